@@ -0,0 +1,429 @@
+"""Pydantic model definitions for Azure DevOps API responses, loaded lazily by models."""
+
+import functools
+from datetime import datetime
+from typing import Annotated, Any, Generic, Literal, Optional, TypeVar, Union
+
+from pydantic import BaseModel, ConfigDict, Discriminator, Field, Tag, TypeAdapter
+from pydantic.alias_generators import to_camel
+from pydantic.dataclasses import dataclass as pydantic_dataclass
+from typing_extensions import TypedDict
+
+
+# Timestamps stay typed datetime fields: pydantic-core parses them natively
+# (including ADO's 7-digit fractions) in the same validate_json pass, at
+# roughly 150 ns each, so deferring the parse is not worth a second attribute
+class ApiModel(BaseModel):
+    """Base for response models; fields map to the API's camelCase names."""
+
+    model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True)
+
+
+# High-volume models are slotted pydantic dataclasses: same validation and
+# aliases as BaseModel, but no per-instance __dict__
+_SLOTTED_CONFIG = ConfigDict(alias_generator=to_camel, populate_by_name=True)
+
+
+def _slotted_model(cls: type) -> type:
+    """Turn a class into a slotted, keyword-only pydantic dataclass."""
+    return pydantic_dataclass(slots=True, kw_only=True, config=_SLOTTED_CONFIG)(cls)
+
+
+def _frozen_model(cls: type) -> type:
+    """Turn a small reference class into a slotted, frozen pydantic dataclass."""
+    return pydantic_dataclass(
+        slots=True, frozen=True, kw_only=True, config=_SLOTTED_CONFIG
+    )(cls)
+
+
+# Embedded References
+# Nested inside larger responses, these are validated as typed dicts keyed by
+# the raw API names rather than as child models, which is much cheaper per row
+class TeamProjectReferenceDict(TypedDict, total=False):
+    """Team project reference embedded in another resource."""
+
+    id: str
+    name: str
+    description: str
+    url: str
+    state: str
+    visibility: str
+
+
+class IdentityRefDict(TypedDict, total=False):
+    """Identity reference embedded in another resource."""
+
+    id: str
+    displayName: str
+    uniqueName: str
+    url: str
+    imageUrl: str
+
+
+class GitRepositoryDict(TypedDict, total=False):
+    """Git repository reference embedded in another resource."""
+
+    id: str
+    name: str
+    url: str
+    project: TeamProjectReferenceDict
+    defaultBranch: str
+    size: int
+    remoteUrl: str
+    sshUrl: str
+    webUrl: str
+
+
+class BuildDefinitionReferenceDict(TypedDict, total=False):
+    """Build definition reference embedded in a build."""
+
+    id: int
+    name: str
+    url: str
+    path: str
+    queueStatus: str
+
+
+# Core Models
+class TeamProjectReference(ApiModel):
+    """Reference to a team project."""
+
+    id: str
+    name: str
+    description: Optional[str] = None
+    url: Optional[str] = None
+    state: Optional[str] = None
+    visibility: Optional[str] = None
+
+
+class WebApiTeam(ApiModel):
+    """Team information."""
+
+    id: str
+    name: str
+    description: Optional[str] = None
+    url: Optional[str] = None
+    project_name: Optional[str] = None
+    project_id: Optional[str] = None
+
+
+class IdentityRef(ApiModel):
+    """Identity reference."""
+
+    id: str
+    display_name: Optional[str] = None
+    unique_name: Optional[str] = None
+    url: Optional[str] = None
+    image_url: Optional[str] = None
+
+
+# Work Item Models
+@_frozen_model
+class WorkItemReference:
+    """Reference to a work item."""
+
+    id: int
+    url: Optional[str] = None
+
+
+@_slotted_model
+class WorkItem:
+    """Work item details."""
+
+    id: int
+    rev: Optional[int] = None
+    fields: Optional[dict[str, Any]] = None
+    relations: Optional[list[dict[str, Any]]] = None
+    url: Optional[str] = None
+
+
+class WorkItemComment(ApiModel):
+    """Work item comment."""
+
+    id: int
+    text: str
+    created_by: Optional[IdentityRefDict] = None
+    created_date: Optional[datetime] = None
+
+
+# Repository Models
+class GitRepository(ApiModel):
+    """Git repository information."""
+
+    id: str
+    name: str
+    url: Optional[str] = None
+    project: Optional[TeamProjectReferenceDict] = None
+    default_branch: Optional[str] = None
+    size: Optional[int] = None
+    remote_url: Optional[str] = None
+    ssh_url: Optional[str] = None
+    web_url: Optional[str] = None
+
+
+@_frozen_model
+class GitRef:
+    """Git reference (branch/tag)."""
+
+    name: str
+    object_id: Optional[str] = None
+    creator: Optional[IdentityRefDict] = None
+    url: Optional[str] = None
+
+
+@_frozen_model
+class GitCommitRef:
+    """Git commit reference."""
+
+    commit_id: str
+    author: Optional[dict[str, Any]] = None
+    committer: Optional[dict[str, Any]] = None
+    comment: Optional[str] = None
+    url: Optional[str] = None
+
+
+@_slotted_model
+class GitPullRequest:
+    """Pull request information."""
+
+    pull_request_id: int
+    repository: Optional[GitRepositoryDict] = None
+    status: Optional[str] = None
+    title: Optional[str] = None
+    description: Optional[str] = None
+    source_ref_name: Optional[str] = None
+    target_ref_name: Optional[str] = None
+    created_by: Optional[IdentityRefDict] = None
+    creation_date: Optional[datetime] = None
+    merge_status: Optional[str] = None
+    is_draft: Optional[bool] = None
+    url: Optional[str] = None
+
+
+class CommentThread(ApiModel):
+    """Pull request comment thread."""
+
+    id: int
+    status: Optional[str] = None
+    comments: Optional[list[dict[str, Any]]] = None
+    thread_context: Optional[dict[str, Any]] = None
+    is_deleted: Optional[bool] = None
+
+
+# Pipeline Models
+class BuildDefinitionReference(ApiModel):
+    """Build definition reference."""
+
+    id: int
+    name: str
+    url: Optional[str] = None
+    path: Optional[str] = None
+    queue_status: Optional[str] = None
+
+
+@_slotted_model
+class Build:
+    """Build information."""
+
+    id: int
+    build_number: Optional[str] = None
+    status: Optional[str] = None
+    result: Optional[str] = None
+    queue_time: Optional[datetime] = None
+    start_time: Optional[datetime] = None
+    finish_time: Optional[datetime] = None
+    definition: Optional[BuildDefinitionReferenceDict] = None
+    requested_by: Optional[IdentityRefDict] = None
+    source_branch: Optional[str] = None
+    source_version: Optional[str] = None
+    url: Optional[str] = None
+
+
+@_slotted_model
+class PipelineRun:
+    """Pipeline run information."""
+
+    id: int
+    name: Optional[str] = None
+    state: Optional[str] = None
+    result: Optional[str] = None
+    created_date: Optional[datetime] = None
+    finished_date: Optional[datetime] = None
+    url: Optional[str] = None
+
+
+# Wiki Models
+class WikiV2(ApiModel):
+    """Wiki information."""
+
+    id: str
+    name: str
+    type: Optional[str] = None
+    project_id: Optional[str] = None
+    repository_id: Optional[str] = None
+    mapped_path: Optional[str] = None
+    url: Optional[str] = None
+
+
+@_slotted_model
+class WikiPage:
+    """Wiki page information."""
+
+    id: Optional[int] = None
+    path: str
+    content: Optional[str] = None
+    git_item_path: Optional[str] = None
+    is_parent_page: Optional[bool] = None
+    order: Optional[int] = None
+    # pydantic resolves this self-reference when the class is created, so the
+    # schema is complete at import and no model_rebuild() pass is needed
+    sub_pages: Optional[list["WikiPage"]] = None
+    url: Optional[str] = None
+
+
+# Test Plan Models
+class TestPlan(ApiModel):
+    """Test plan information."""
+
+    id: int
+    name: str
+    description: Optional[str] = None
+    state: Optional[str] = None
+    iteration: Optional[str] = None
+    area_path: Optional[str] = None
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+
+
+class TestSuite(ApiModel):
+    """Test suite information."""
+
+    id: int
+    name: str
+    suite_type: Optional[str] = None
+    plan: Optional[dict[str, Any]] = None
+    parent_suite: Optional[dict[str, Any]] = None
+
+
+class StaticTestSuite(TestSuite):
+    """Test suite whose test cases are added by hand."""
+
+    suite_type: Literal["staticTestSuite"]
+
+
+class DynamicTestSuite(TestSuite):
+    """Test suite populated by a work item query."""
+
+    suite_type: Literal["dynamicTestSuite"]
+    query_string: Optional[str] = None
+
+
+class RequirementTestSuite(TestSuite):
+    """Test suite linked to a requirement work item."""
+
+    suite_type: Literal["requirementTestSuite"]
+    requirement_id: Optional[int] = None
+
+
+class OtherTestSuite(TestSuite):
+    """Test suite of a type without a dedicated model, e.g. ``none``."""
+
+
+_SUITE_TYPES = frozenset({"staticTestSuite", "dynamicTestSuite", "requirementTestSuite"})
+
+
+def _suite_type_tag(value: Any) -> str:
+    """Pick the suite model for raw or already built suite data."""
+    if isinstance(value, dict):
+        suite_type = value.get("suiteType", value.get("suite_type"))
+    else:
+        suite_type = getattr(value, "suite_type", None)
+    return suite_type if suite_type in _SUITE_TYPES else "other"
+
+
+# Validated by dispatching on suiteType instead of trying each suite model;
+# unknown types fall back to OtherTestSuite so one odd suite cannot fail a listing
+AnyTestSuite = Annotated[
+    Union[
+        Annotated[StaticTestSuite, Tag("staticTestSuite")],
+        Annotated[DynamicTestSuite, Tag("dynamicTestSuite")],
+        Annotated[RequirementTestSuite, Tag("requirementTestSuite")],
+        Annotated[OtherTestSuite, Tag("other")],
+    ],
+    Discriminator(_suite_type_tag),
+]
+
+
+class TestCase(ApiModel):
+    """Test case information."""
+
+    id: int
+    name: Optional[str] = None
+    work_item: Optional[WorkItemReference] = None
+    point_assignments: Optional[list[dict[str, Any]]] = None
+
+
+# Iteration Models
+class TeamSettingsIteration(ApiModel):
+    """Team iteration settings."""
+
+    id: str
+    name: str
+    path: str
+    attributes: Optional[dict[str, Any]] = None
+    url: Optional[str] = None
+
+
+# Search Models
+class CodeSearchResult(ApiModel):
+    """Code search result."""
+
+    file_name: Optional[str] = None
+    path: Optional[str] = None
+    repository: Optional[dict[str, Any]] = None
+    project: Optional[dict[str, Any]] = None
+    matches: Optional[dict[str, Any]] = None
+    content_id: Optional[str] = None
+
+
+# API Response Wrappers
+T = TypeVar("T")
+
+
+@_frozen_model
+class ListResponse(Generic[T]):
+    """Generic list response wrapper, e.g. ListResponse[WorkItem]."""
+
+    count: int
+    value: list[T]
+
+
+# Decoding
+@functools.lru_cache(maxsize=None)
+def adapter(model: Any) -> TypeAdapter[Any]:
+    """Get the shared TypeAdapter for a model or type such as list[WorkItem]."""
+    return TypeAdapter(model)
+
+
+def list_adapter(model: Any) -> TypeAdapter[Any]:
+    """Get the shared adapter for a {count, value} list response of model."""
+    return adapter(ListResponse[model])
+
+
+def decode(model: Any, raw: bytes) -> Any:
+    """Validate raw JSON bytes straight into model in a single parse.
+
+    Example:
+        work_items = decode(list[WorkItem], response.content)
+    """
+    return adapter(model).validate_json(raw)
+
+
+# Adapters for the most common responses, built once at import
+WORK_ITEM_ADAPTER = adapter(WorkItem)
+WORK_ITEM_LIST_ADAPTER = adapter(ListResponse[WorkItem])
+PULL_REQUEST_ADAPTER = adapter(GitPullRequest)
+PULL_REQUEST_LIST_ADAPTER = adapter(ListResponse[GitPullRequest])
+BUILD_ADAPTER = adapter(Build)
+BUILD_LIST_ADAPTER = adapter(ListResponse[Build])
+TEST_SUITE_LIST_ADAPTER = adapter(ListResponse[AnyTestSuite])
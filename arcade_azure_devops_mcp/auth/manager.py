@@ -1,9 +1,18 @@
 """Authentication manager for Azure DevOps with PAT and OAuth support."""
 
-import base64
+import functools
+import math
 import os
+import time
+import weakref
+from binascii import b2a_base64
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Mapping, Optional
+
+if TYPE_CHECKING:
+    from .oauth import OAuthHandler
 
 
 class AuthenticationError(Exception):
@@ -12,9 +21,28 @@ class AuthenticationError(Exception):
     pass
 
 
-@dataclass
+# Raised by context.get_secret when a secret is not available (Arcade raises ValueError)
+_MISSING_SECRET_ERRORS = (ValueError, LookupError)
+
+
+def _context_secret(context: Any, name: str) -> Optional[str]:
+    """Look up one secret from an Arcade context, or None if it is not available."""
+    get_secret = getattr(context, "get_secret", None)
+    if get_secret is None:
+        return None
+    try:
+        return get_secret(name)
+    except _MISSING_SECRET_ERRORS:
+        return None
+
+
+@dataclass(frozen=True, slots=True)
 class AuthConfig:
-    """Configuration for Azure DevOps authentication."""
+    """Configuration for Azure DevOps authentication.
+
+    Instances are immutable and hashable, so cached configs can be shared
+    safely between managers.
+    """
 
     organization: str
     pat: Optional[str] = None
@@ -24,50 +52,65 @@ class AuthConfig:
 
     @classmethod
     def from_env(cls) -> "AuthConfig":
-        """Create AuthConfig from environment variables."""
+        """Create AuthConfig from environment variables.
+
+        Configs are memoized on the environment values, so repeated calls
+        with an unchanged environment return the same instance.
+        """
         org = os.environ.get("AZURE_DEVOPS_ORG")
         if not org:
             raise AuthenticationError(
                 "AZURE_DEVOPS_ORG environment variable is required"
             )
 
-        return cls(
-            organization=org,
-            pat=os.environ.get("AZURE_DEVOPS_PAT"),
-            oauth_client_id=os.environ.get("AZURE_AD_CLIENT_ID"),
-            oauth_client_secret=os.environ.get("AZURE_AD_CLIENT_SECRET"),
-            oauth_tenant_id=os.environ.get("AZURE_AD_TENANT_ID"),
+        return _config_from_env_tuple(
+            org,
+            os.environ.get("AZURE_DEVOPS_PAT"),
+            os.environ.get("AZURE_AD_CLIENT_ID"),
+            os.environ.get("AZURE_AD_CLIENT_SECRET"),
+            os.environ.get("AZURE_AD_TENANT_ID"),
         )
 
     @classmethod
     def from_context(cls, context: Any) -> "AuthConfig":
         """Create AuthConfig from Arcade context secrets.
+
+        The parsed config is remembered for the lifetime of the context.
         
         Args:
             context: Arcade MCP context with get_secret method
         """
-        # Try to get organization from context or env
         try:
-            org = context.get_secret("AZURE_DEVOPS_ORG")
-        except Exception:
+            cached = _CONTEXT_CONFIGS.get(context)
+        except TypeError:
+            cached = None
+        if cached is not None:
+            return cached
+
+        # Look each secret up separately, so one missing from the context
+        # falls back to env without discarding the other
+        org = _context_secret(context, "AZURE_DEVOPS_ORG")
+        if org is None:
             org = os.environ.get("AZURE_DEVOPS_ORG")
-        
+
         if not org:
             raise AuthenticationError(
                 "AZURE_DEVOPS_ORG not found in secrets or environment"
             )
 
-        # Try to get PAT from context or env
-        pat = None
-        try:
-            pat = context.get_secret("AZURE_DEVOPS_PAT")
-        except Exception:
+        pat = _context_secret(context, "AZURE_DEVOPS_PAT")
+        if pat is None:
             pat = os.environ.get("AZURE_DEVOPS_PAT")
 
-        return cls(
+        config = cls(
             organization=org,
             pat=pat,
         )
+        try:
+            _CONTEXT_CONFIGS[context] = config
+        except TypeError:
+            pass
+        return config
 
     @classmethod
     def from_env_or_context(cls, context: Optional[Any] = None) -> "AuthConfig":
@@ -76,39 +119,99 @@ class AuthConfig:
         Args:
             context: Optional Arcade MCP context with get_secret method
         """
-        # First try environment variables
-        org = os.environ.get("AZURE_DEVOPS_ORG")
-        pat = os.environ.get("AZURE_DEVOPS_PAT")
+        # First try environment variables, read once
+        env = os.environ
+        org = env.get("AZURE_DEVOPS_ORG")
+        pat = env.get("AZURE_DEVOPS_PAT")
+        client_id = env.get("AZURE_AD_CLIENT_ID")
+        client_secret = env.get("AZURE_AD_CLIENT_SECRET")
+        tenant_id = env.get("AZURE_AD_TENANT_ID")
         
         # If env vars are set, use them
         if org and pat:
-            return cls(
-                organization=org,
-                pat=pat,
-                oauth_client_id=os.environ.get("AZURE_AD_CLIENT_ID"),
-                oauth_client_secret=os.environ.get("AZURE_AD_CLIENT_SECRET"),
-                oauth_tenant_id=os.environ.get("AZURE_AD_TENANT_ID"),
-            )
+            return _config_from_env_tuple(org, pat, client_id, client_secret, tenant_id)
         
-        # Fall back to Arcade context secrets
-        if context is not None:
-            try:
-                if not org:
-                    org = context.get_secret("AZURE_DEVOPS_ORG")
-                if not pat:
-                    pat = context.get_secret("AZURE_DEVOPS_PAT")
-            except Exception:
-                pass
+        # Reuse secrets recently resolved for the same user. Contexts without
+        # a user are never cached, so one caller's secrets cannot reach another
+        cache_key: Optional[str] = getattr(context, "user_id", None) or None
+        if cache_key is not None:
+            cached = _SECRET_CONFIGS.get(cache_key)
+            if cached is not None and cached[0] > time.monotonic():
+                return cached[1]
+
+        # Fall back to Arcade context secrets, each looked up on its own so a
+        # missing org does not skip the PAT
+        if not org:
+            org = _context_secret(context, "AZURE_DEVOPS_ORG")
+        if not pat:
+            pat = _context_secret(context, "AZURE_DEVOPS_PAT")
         
         if not org:
             raise AuthenticationError(
                 "AZURE_DEVOPS_ORG not found in environment or Arcade secrets"
             )
 
-        return cls(
+        config = cls(
             organization=org,
             pat=pat,
+            oauth_client_id=client_id,
+            oauth_client_secret=client_secret,
+            oauth_tenant_id=tenant_id,
         )
+        if cache_key is None:
+            return config
+        now = time.monotonic()
+        _SECRET_CONFIGS.pop(cache_key, None)
+        if len(_SECRET_CONFIGS) >= SECRET_CACHE_MAX_ENTRIES:
+            for key in [k for k, (expiry, _) in _SECRET_CONFIGS.items() if expiry <= now]:
+                del _SECRET_CONFIGS[key]
+            # Entries are kept in insertion order, so evict the oldest live ones
+            while len(_SECRET_CONFIGS) >= SECRET_CACHE_MAX_ENTRIES:
+                _SECRET_CONFIGS.popitem(last=False)
+        _SECRET_CONFIGS[cache_key] = (now + SECRET_CACHE_TTL, config)
+        return config
+
+
+# Configs parsed from Arcade contexts, dropped once the context is collected
+_CONTEXT_CONFIGS: "weakref.WeakKeyDictionary[Any, AuthConfig]" = weakref.WeakKeyDictionary()
+
+# Configs resolved from Arcade secrets, keyed by user, so new sessions skip
+# the secret lookups until the TTL lapses or the API rejects the credentials
+SECRET_CACHE_TTL = 900.0
+SECRET_CACHE_MAX_ENTRIES = 256
+_SECRET_CONFIGS: "OrderedDict[str, tuple[float, AuthConfig]]" = OrderedDict()
+
+
+def _forget_cached_config(config: AuthConfig) -> None:
+    """Drop cached secret-derived configs so the next lookup re-reads secrets."""
+    for key in [k for k, (_, cached) in _SECRET_CONFIGS.items() if cached == config]:
+        del _SECRET_CONFIGS[key]
+
+
+@functools.lru_cache(maxsize=4)
+def _config_from_env_tuple(
+    org: str,
+    pat: Optional[str],
+    client_id: Optional[str],
+    client_secret: Optional[str],
+    tenant_id: Optional[str],
+) -> AuthConfig:
+    """Build an AuthConfig from environment values, memoized on those values."""
+    return AuthConfig(
+        organization=org,
+        pat=pat,
+        oauth_client_id=client_id,
+        oauth_client_secret=client_secret,
+        oauth_tenant_id=tenant_id,
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _basic_auth_headers(pat: str) -> Mapping[str, str]:
+    """Build the Basic auth header for a PAT, shared by every manager using it."""
+    # PATs are plain ASCII, so skip the UTF-8 codec and base64 wrapper
+    encoded = b2a_base64(b":" + pat.encode("ascii"), newline=False).decode("ascii")
+    return MappingProxyType({"Authorization": "Basic " + encoded})
 
 
 class AuthManager:
@@ -125,57 +228,131 @@ class AuthManager:
             config: Authentication configuration. If None, loads from environment or context.
             context: Optional Arcade MCP context for secrets fallback.
         """
-        if config:
-            self.config = config
-        else:
-            self.config = AuthConfig.from_env_or_context(context)
-        self._oauth_token: Optional[str] = None
+        self.config = config if config else AuthConfig.from_env_or_context(context)
+
+    @property
+    def config(self) -> AuthConfig:
+        """Get the authentication configuration."""
+        return self._config
+
+    @config.setter
+    def config(self, config: AuthConfig) -> None:
+        """Set the authentication configuration and rebuild cached headers."""
+        previous = getattr(self, "_oauth", None)
+        if previous is not None:
+            previous.close()
+        self._config = config
+        self._oauth: Optional["OAuthHandler"] = None
+        self._bearer: Optional[tuple[str, Mapping[str, str]]] = None
+        self._pat_headers = _basic_auth_headers(config.pat) if config.pat else None
+        self._has_creds = bool(config.pat) or bool(
+            config.oauth_client_id
+            and config.oauth_client_secret
+            and config.oauth_tenant_id
+        )
 
     @property
     def organization(self) -> str:
         """Get the Azure DevOps organization name."""
         return self.config.organization
 
-    def get_headers(self) -> dict[str, str]:
+    def get_headers(self) -> Mapping[str, str]:
         """Get authorization headers for API requests.
 
+        The PAT header is encoded once per config and shared between calls
+        as a read-only mapping, so callers must copy it to add headers.
+
         Returns:
-            Dictionary containing Authorization header.
+            Read-only mapping containing the Authorization header.
 
         Raises:
             AuthenticationError: If no valid credentials are configured.
         """
         # Prioritize PAT authentication
-        if self.config.pat:
-            encoded = base64.b64encode(f":{self.config.pat}".encode()).decode()
-            return {"Authorization": f"Basic {encoded}"}
+        if self._pat_headers is not None:
+            return self._pat_headers
 
-        # Fall back to OAuth token if available
-        if self._oauth_token:
-            return {"Authorization": f"Bearer {self._oauth_token}"}
+        # Fall back to the last OAuth token fetched by get_headers_async
+        if self._bearer is not None:
+            return self._bearer[1]
 
         raise AuthenticationError(
             "No valid credentials configured. Set AZURE_DEVOPS_PAT or configure Arcade secrets."
         )
 
-    async def get_headers_async(self) -> dict[str, str]:
+    async def get_headers_async(self) -> Mapping[str, str]:
         """Get authorization headers, fetching OAuth token if needed.
 
         Returns:
-            Dictionary containing Authorization header.
+            Read-only mapping containing the Authorization header.
 
         Raises:
             AuthenticationError: If no valid credentials are configured.
         """
         # Prioritize PAT authentication
-        if self.config.pat:
-            encoded = base64.b64encode(f":{self.config.pat}".encode()).decode()
-            return {"Authorization": f"Basic {encoded}"}
+        if self._pat_headers is not None:
+            return self._pat_headers
+
+        # Fall back to OAuth client credentials
+        oauth = self._get_oauth_handler()
+        if oauth is not None:
+            token = await oauth.get_access_token()
+            if not token:
+                raise AuthenticationError("Failed to acquire an Azure AD access token.")
+            bearer = self._bearer
+            if bearer is None or bearer[0] != token:
+                bearer = (token, MappingProxyType({"Authorization": f"Bearer {token}"}))
+                self._bearer = bearer
+            return bearer[1]
 
         raise AuthenticationError(
             "No valid credentials configured. Set AZURE_DEVOPS_PAT or configure Arcade secrets."
         )
 
+    def headers_expire_at(self) -> float:
+        """Get the monotonic time until which the current headers stay valid.
+
+        PAT headers never expire; OAuth headers expire with their token.
+        """
+        if self._pat_headers is not None:
+            return math.inf
+        if self._oauth is not None:
+            return self._oauth.token_expires_at
+        return 0.0
+
+    def invalidate_token(self) -> None:
+        """Drop any cached OAuth token and cached secrets after a rejected request."""
+        self._bearer = None
+        if self._oauth is not None:
+            self._oauth.clear_cache()
+        _forget_cached_config(self.config)
+
+    def close(self) -> None:
+        """Stop background token refreshes for this manager."""
+        if self._oauth is not None:
+            self._oauth.close()
+
+    def _get_oauth_handler(self) -> Optional["OAuthHandler"]:
+        """Get or create the OAuth handler if client credentials are configured."""
+        if self._oauth is None:
+            config = self.config
+            if not (
+                config.oauth_client_id
+                and config.oauth_client_secret
+                and config.oauth_tenant_id
+            ):
+                return None
+
+            # Imported lazily so PAT-only setups never load MSAL
+            from .oauth import OAuthHandler
+
+            self._oauth = OAuthHandler(
+                client_id=config.oauth_client_id,
+                client_secret=config.oauth_client_secret,
+                tenant_id=config.oauth_tenant_id,
+            )
+        return self._oauth
+
     def has_valid_credentials(self) -> bool:
-        """Check if valid credentials are available."""
-        return bool(self.config.pat)
+        """Check if a PAT or complete OAuth client credentials are configured."""
+        return self._has_creds
@@ -1,10 +1,20 @@
 """OAuth/Azure AD authentication handler for Azure DevOps."""
 
 import asyncio
+import logging
+import threading
+import time
 from typing import Optional
 
 from msal import ConfidentialClientApplication
 
+logger = logging.getLogger(__name__)
+
+# MSAL apps shared by every handler with the same credentials, so the token
+# cache and authority discovery survive handler re-creation
+_MSAL_APPS: dict[tuple[str, str, str], ConfidentialClientApplication] = {}
+_MSAL_APPS_LOCK = threading.Lock()
+
 
 class OAuthHandler:
     """Handles OAuth authentication with Azure AD for Azure DevOps."""
@@ -12,6 +22,12 @@ class OAuthHandler:
     # Azure DevOps resource scope for OAuth
     AZURE_DEVOPS_SCOPE = "499b84ac-1321-427f-aa17-267ca6975798/.default"
 
+    # Seconds before the reported expiry at which a cached token is treated as stale
+    EXPIRY_MARGIN = 60
+
+    # Seconds before the reported expiry at which a background refresh is started
+    REFRESH_MARGIN = 120
+
     def __init__(
         self,
         client_id: str,
@@ -28,55 +44,137 @@ class OAuthHandler:
         self.client_id = client_id
         self.client_secret = client_secret
         self.tenant_id = tenant_id
+        self._authority = "https://login.microsoftonline.com/" + tenant_id
         self._app: Optional[ConfidentialClientApplication] = None
-        self._cached_token: Optional[str] = None
+        self._cached: Optional[tuple[str, float]] = None
+        self._lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._acquired_at = 0.0
+        self._last_used = 0.0
 
     def _get_msal_app(self) -> ConfidentialClientApplication:
-        """Get or create MSAL confidential client application."""
+        """Get or create the shared MSAL confidential client application."""
         if self._app is None:
-            authority = f"https://login.microsoftonline.com/{self.tenant_id}"
-            self._app = ConfidentialClientApplication(
-                client_id=self.client_id,
-                client_credential=self.client_secret,
-                authority=authority,
-            )
+            key = (self.tenant_id, self.client_id, self.client_secret)
+            with _MSAL_APPS_LOCK:
+                app = _MSAL_APPS.get(key)
+                if app is None:
+                    app = ConfidentialClientApplication(
+                        client_id=self.client_id,
+                        client_credential=self.client_secret,
+                        authority=self._authority,
+                    )
+                    _MSAL_APPS[key] = app
+            self._app = app
         return self._app
 
+    def _fresh_token(self) -> Optional[str]:
+        """Return the cached token if it is not about to expire."""
+        cached = self._cached
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+        return None
+
     async def get_access_token(self) -> Optional[str]:
         """Get access token for Azure DevOps.
 
         Uses client credentials flow for service-to-service authentication.
+        A fresh cached token is returned without awaiting anything; otherwise
+        concurrent callers are serialized so only one of them calls MSAL.
 
         Returns:
             Access token string or None if acquisition fails.
         """
-        app = self._get_msal_app()
-
+        self._last_used = time.monotonic()
+        token = self._fresh_token()
+        if token is not None:
+            return token
+
+        async with self._lock:
+            # Another caller may have refreshed the token while we waited
+            token = self._fresh_token()
+            if token is not None:
+                return token
+            return await self._acquire_token()
+
+    async def _acquire_token(self) -> Optional[str]:
+        """Acquire a token from Azure AD via MSAL."""
         # Run token acquisition in thread pool to avoid blocking
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            None,
-            lambda: app.acquire_token_for_client(scopes=[self.AZURE_DEVOPS_SCOPE]),
-        )
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(None, self._acquire_sync)
 
         if result and "access_token" in result:
-            self._cached_token = result["access_token"]
-            return self._cached_token
+            token = result["access_token"]
+            expires_in = result.get("expires_in", 3600)
+            self._acquired_at = now = time.monotonic()
+            self._cached = (token, now + expires_in - self.EXPIRY_MARGIN)
+            self._schedule_refresh(expires_in - self.REFRESH_MARGIN)
+            return token
 
         # Log error details for debugging
         if result and "error" in result:
             error = result.get("error", "Unknown error")
             error_desc = result.get("error_description", "No description")
-            print(f"OAuth error: {error} - {error_desc}")
+            logger.error("OAuth error: %s - %s", error, error_desc)
 
         return None
 
+    def _acquire_sync(self) -> Optional[dict]:
+        """Run the blocking MSAL client credentials flow."""
+        app = self._get_msal_app()
+        return app.acquire_token_for_client(scopes=[self.AZURE_DEVOPS_SCOPE])
+
+    def _schedule_refresh(self, delay: float) -> None:
+        """Schedule a background refresh so callers never wait on an expired token."""
+        self._cancel_refresh()
+        if delay > 0:
+            self._refresh_task = asyncio.get_running_loop().create_task(self._prefetch(delay))
+
+    def _cancel_refresh(self) -> None:
+        """Cancel a pending background refresh, unless it is the caller."""
+        task = self._refresh_task
+        self._refresh_task = None
+        if task is None:
+            return
+        try:
+            current = asyncio.current_task()
+        except RuntimeError:
+            current = None
+        if task is not current:
+            task.cancel()
+
+    async def _prefetch(self, delay: float) -> None:
+        """Refresh the token after delay seconds if it was used since it was acquired.
+
+        An idle handler is left to fetch a new token on demand, so handlers
+        whose session has gone away stop calling MSAL.
+        """
+        await asyncio.sleep(delay)
+        if self._last_used < self._acquired_at:
+            self._refresh_task = None
+            return
+        try:
+            async with self._lock:
+                await self._acquire_token()
+        except Exception:
+            logger.warning("Background OAuth token refresh failed", exc_info=True)
+
+    @property
+    def token_expires_at(self) -> float:
+        """Monotonic time at which the cached token stops being served, or 0."""
+        cached = self._cached
+        return cached[1] if cached is not None else 0.0
+
     def get_cached_token(self) -> Optional[str]:
-        """Get cached token if available."""
-        return self._cached_token
+        """Get cached token if available and not about to expire."""
+        return self._fresh_token()
+
+    def close(self) -> None:
+        """Cancel any scheduled refresh; the cached token stays usable."""
+        self._cancel_refresh()
 
     def clear_cache(self) -> None:
-        """Clear cached token."""
-        self._cached_token = None
-        self._app = None
+        """Clear cached token and cancel any scheduled refresh."""
+        self._cancel_refresh()
+        self._cached = None
 
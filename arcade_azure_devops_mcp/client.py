@@ -1,13 +1,186 @@
 """Azure DevOps REST API client."""
 
-from typing import Any, Optional
-from urllib.parse import quote
+import asyncio
+import functools
+import hashlib
+import hmac
+import itertools
+import os
+import random
+import re
+import secrets
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Awaitable, Callable, Mapping, Optional, Union
+from urllib.parse import quote, urlencode
 
 import httpx
+import orjson
 
 from .auth.manager import AuthManager
 
 
+@functools.lru_cache(maxsize=256)
+def _quote(segment: str) -> str:
+    """URL-quote a project or team name; a session only touches a handful of them."""
+    return quote(segment)
+
+
+def _error_message(body: bytes) -> str:
+    """Extract the message from an Azure DevOps error body, decoding it once."""
+    try:
+        payload = orjson.loads(body)
+    except orjson.JSONDecodeError:
+        payload = None
+    if isinstance(payload, dict) and "message" in payload:
+        return str(payload["message"])
+    return body.decode("utf-8", "replace")
+
+
+# GUIDs, commit SHAs and numeric IDs are already URL-safe
+_IS_SAFE_ID = re.compile(r"[0-9A-Fa-f-]+").fullmatch
+_quote_segment = functools.partial(quote, safe="")
+
+
+def _safe_id(value: Any) -> str:
+    """Format a single path segment, only quoting it when it could need it."""
+    if isinstance(value, int):
+        return str(value)
+    if _IS_SAFE_ID(value):
+        return value
+    return _quote_segment(value)
+
+
+def serialize_patch(document: list[dict[str, Any]]) -> bytes:
+    """Serialize a JSON patch document once for reuse across many requests.
+
+    Example:
+        patch = serialize_patch([{"op": "add", "path": "/fields/System.State", "value": "Closed"}])
+        for work_item_id in ids:
+            await client.update_work_item(project, work_item_id, patch)
+    """
+    return orjson.dumps(document)
+
+
+_JSON_PATCH_HEADERS = {"Content-Type": "application/json-patch+json"}
+
+
+def _patch_body(document: Union[list[dict[str, Any]], bytes]) -> dict[str, Any]:
+    """Get the _request body argument for a raw or pre-serialized patch."""
+    if isinstance(document, bytes):
+        return {"json_bytes": document}
+    return {"json": document}
+
+
+@functools.lru_cache(maxsize=256)
+def _search_body(
+    search_text: str,
+    project: Optional[str],
+    repository: Optional[str],
+    path: Optional[str],
+    branch: Optional[str],
+    top: int,
+    skip: int,
+) -> bytes:
+    """Serialize a code search request body, reusing it for repeated searches."""
+    filters = {
+        key: [value]
+        for key, value in (
+            ("Project", project),
+            ("Repository", repository),
+            ("Path", path),
+            ("Branch", branch),
+        )
+        if value
+    }
+    return orjson.dumps(
+        {
+            "searchText": search_text,
+            "$top": top,
+            "$skip": skip,
+            "filters": filters,
+        }
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _open_disk_cache(directory: str) -> tuple[Any, bytes]:
+    """Open one on-disk response cache per directory for the whole process.
+
+    Returns the cache and its secret salt, which is generated once and kept
+    in the cache so key namespaces stay stable across restarts.
+    """
+    # Imported lazily so the diskcache extra stays optional
+    from diskcache import Cache
+
+    cache = Cache(directory, tag_index=True)
+    cache.add("ado-mcp:salt", secrets.token_bytes(32))
+    return cache, cache.get("ado-mcp:salt")
+
+
+def _disk_cache() -> Optional[tuple[Any, bytes]]:
+    """Get the on-disk response cache and salt, if AZURE_DEVOPS_DISK_CACHE enables it.
+
+    Set it to 1 for ``~/.cache/ado-mcp`` or to a directory path.
+    """
+    setting = os.environ.get("AZURE_DEVOPS_DISK_CACHE")
+    if not setting or setting == "0":
+        return None
+    directory = "~/.cache/ado-mcp" if setting == "1" else setting
+    return _open_disk_cache(os.path.expanduser(directory))
+
+
+def _content_cache_ttl(default: float) -> float:
+    """Get the code search and wiki cache TTL from AZURE_DEVOPS_CACHE_TTL.
+
+    Falls back to default when the variable is unset or not a number.
+    """
+    setting = os.environ.get("AZURE_DEVOPS_CACHE_TTL")
+    if not setting:
+        return default
+    try:
+        return float(setting)
+    except ValueError:
+        return default
+
+
+# In-flight request slots per event loop and organization, shared by every
+# client on that loop; a semaphore must not outlive or cross its loop
+_REQUEST_SLOTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]]"
+_REQUEST_SLOTS = weakref.WeakKeyDictionary()
+
+
+def _request_slots(organization: str, limit: int) -> asyncio.Semaphore:
+    """Get the running loop's semaphore capping concurrent requests to an organization."""
+    loop = asyncio.get_running_loop()
+    per_loop = _REQUEST_SLOTS.get(loop)
+    if per_loop is None:
+        per_loop = _REQUEST_SLOTS[loop] = {}
+    slots = per_loop.get(organization)
+    if slots is None:
+        slots = per_loop[organization] = asyncio.Semaphore(limit)
+    return slots
+
+
+def _invalidates_project(method: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """Drop a project's cached responses once a write method on it completes.
+
+    Invalidating after the request (even a failed one, which may have been
+    applied) means a read racing the write cannot leave pre-write data cached.
+    The project must be the method's first argument.
+    """
+
+    @functools.wraps(method)
+    async def wrapper(self: "AzureDevOpsClient", project: str, *args: Any, **kwargs: Any) -> Any:
+        try:
+            return await method(self, project, *args, **kwargs)
+        finally:
+            await self._invalidate_project(project)
+
+    return wrapper
+
+
 class AzureDevOpsClientError(Exception):
     """Error from Azure DevOps API."""
 
@@ -17,7 +190,14 @@ class AzureDevOpsClientError(Exception):
 
 
 class AzureDevOpsClient:
-    """Async HTTP client for Azure DevOps REST API v7.1."""
+    """Async HTTP client for Azure DevOps REST API v7.1.
+
+    Use it as an async context manager so the connection pool is always
+    closed::
+
+        async with AzureDevOpsClient(auth_manager) as client:
+            projects = await client.list_projects()
+    """
 
     BASE_URL = "https://dev.azure.com/{organization}"
     VSSPS_URL = "https://vssps.dev.azure.com/{organization}"
@@ -25,48 +205,308 @@ class AzureDevOpsClient:
     SEARCH_URL = "https://almsearch.dev.azure.com/{organization}"
     API_VERSION = "7.1"
 
-    def __init__(self, auth_manager: AuthManager):
+    _DEFAULT_PARAMS = {"api-version": API_VERSION}
+    _STATIC_HEADERS = {
+        "Content-Type": "application/json",
+        "Accept": "application/json",
+    }
+
+    # Many small requests fan out to a handful of ADO hosts, so keep plenty of
+    # warm connections around and multiplex them over HTTP/2
+    TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+    POOL_LIMITS = httpx.Limits(
+        max_connections=200,
+        max_keepalive_connections=100,
+        keepalive_expiry=90.0,
+    )
+
+    # Each ADO host gets its own transport and pool so a burst against one
+    # (e.g. code search) cannot starve connections to the others
+    HOSTS = (
+        "dev.azure.com",
+        "vssps.dev.azure.com",
+        "vsrm.dev.azure.com",
+        "almsearch.dev.azure.com",
+    )
+    HOST_POOL_LIMITS = httpx.Limits(
+        max_connections=100,
+        max_keepalive_connections=50,
+        keepalive_expiry=120.0,
+    )
+
+    # Azure DevOps throttles with 429 (and sheds load with 503); retry those on
+    # the same pooled connection, honouring Retry-After when it is sent. A 503
+    # may come from a gateway after a write was applied, so writes (POST,
+    # PATCH) are only retried on 429, which ADO sends before doing any work
+    RETRY_STATUSES = frozenset({429, 503})
+    WRITE_RETRY_STATUSES = frozenset({429})
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE"})
+    MAX_RETRIES = 3
+    RETRY_BACKOFF = 1.0
+    MAX_RETRY_DELAY = 30.0
+
+    # Cap in-flight requests per organization across all sessions, so bursts
+    # queue in-process instead of tripping ADO throttling (429) and retries
+    MAX_CONCURRENT_REQUESTS = 20
+
+    # Upper bound on $skip pages fetched by one list_all_* call, so a server
+    # that keeps returning full pages cannot loop forever
+    MAX_LIST_PAGES = 1000
+
+    # Largest ID list accepted by the work items batch endpoint
+    WORK_ITEMS_BATCH_SIZE = 200
+
+    # Metadata reads (projects, repos, wikis, ...) rarely change within a session
+    CACHE_TTL_GET = 300.0
+    CACHE_TTL_LIST = 60.0
+    CACHE_MAX_ENTRIES = 256
+
+    # Code searches and wiki pages are often re-requested within seconds by an
+    # agent; AZURE_DEVOPS_CACHE_TTL overrides this and 0 disables caching them
+    CACHE_TTL_CONTENT = 60.0
+
+    # With AZURE_DEVOPS_DISK_CACHE set, those responses also survive restarts
+    DISK_CACHE_TTL_SEARCH = 300.0
+    DISK_CACHE_TTL_WIKI = 3600.0
+
+    def __init__(self, auth_manager: AuthManager, http: Optional[httpx.AsyncClient] = None):
         """Initialize the client.
 
         Args:
             auth_manager: AuthManager instance for authentication.
+            http: Optional shared HTTP client (see ``create_http_client``). It is
+                not closed by ``close``, so its pool outlives this client.
         """
         self.auth = auth_manager
-        self._client: Optional[httpx.AsyncClient] = None
+        organization = auth_manager.organization
+        self._base = self.BASE_URL.format(organization=organization)
+        self._vssps = self.VSSPS_URL.format(organization=organization)
+        self._vsrm = self.VSRM_URL.format(organization=organization)
+        self._search = self.SEARCH_URL.format(organization=organization)
+        self._project_base: dict[str, str] = {}
+        self._team_bases: dict[tuple[str, str], str] = {}
+        self._iterations_urls: dict[tuple[str, str], str] = {}
+        self._client = http
+        self._owns_client = http is None
+        self._client_lock = asyncio.Lock()
+        self._auth_headers: Optional[Mapping[str, str]] = None
+        self._auth_expires_at = 0.0
+        self._cache: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future[bytes]] = {}
+        # Bumped by every invalidation; a response fetched across one is
+        # returned to its callers but not cached, as it may predate a write
+        self._generation = 0
+        self._content_ttl = _content_cache_ttl(self.CACHE_TTL_CONTENT)
+        self._organization = organization
+        self._slots: Optional[tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = None
+        self._disk: Optional[Any] = None
+        disk = _disk_cache()
+        if disk is not None:
+            # Namespace disk entries by organization and credential so cached
+            # responses are never served to a different identity; keyed with
+            # the cache's salt so the credential cannot be recovered from keys
+            self._disk, salt = disk
+            config = auth_manager.config
+            identity = f"{organization}:{config.pat or config.oauth_client_id or ''}"
+            self._disk_namespace = hmac.new(
+                salt, identity.encode(), hashlib.sha256
+            ).hexdigest()[:32]
 
     @property
     def base_url(self) -> str:
         """Get the base URL for the organization."""
-        return self.BASE_URL.format(organization=self.auth.organization)
+        return self._base
 
     @property
     def vssps_url(self) -> str:
         """Get the VSSPS URL for identity operations."""
-        return self.VSSPS_URL.format(organization=self.auth.organization)
+        return self._vssps
+
+    @property
+    def vsrm_url(self) -> str:
+        """Get the VSRM URL for release operations."""
+        return self._vsrm
 
     @property
     def search_url(self) -> str:
         """Get the search URL."""
-        return self.SEARCH_URL.format(organization=self.auth.organization)
+        return self._search
+
+    def _pbase(self, project: str) -> str:
+        """Get the quoted base URL for a project, built once per project."""
+        base = self._project_base.get(project)
+        if base is None:
+            base = self._project_base[project] = f"{self._base}/{_quote(project)}"
+        return base
+
+    def _team_base(self, project: str, team: str) -> str:
+        """Get the quoted base URL for a team, built once per team."""
+        key = (project, team)
+        base = self._team_bases.get(key)
+        if base is None:
+            base = self._team_bases[key] = f"{self._pbase(project)}/{_quote(team)}"
+        return base
+
+    def _iterations_url(self, project: str, team: str) -> str:
+        """Get the team iterations URL, built once per team."""
+        key = (project, team)
+        url = self._iterations_urls.get(key)
+        if url is None:
+            url = self._iterations_urls[key] = (
+                f"{self._team_base(project, team)}/_apis/work/teamsettings/iterations"
+            )
+        return url
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(timeout=30.0)
-        return self._client
+        client = self._client
+        if client is not None and not client.is_closed:
+            return client
+
+        # Concurrent first calls must share one client (and its pool)
+        async with self._client_lock:
+            if self._client is None or self._client.is_closed:
+                self._client = self.create_http_client()
+                self._owns_client = True
+            return self._client
+
+    @classmethod
+    def create_http_client(cls) -> httpx.AsyncClient:
+        """Create an HTTP client configured for the Azure DevOps hosts.
+
+        Pass the result to several ``AzureDevOpsClient`` instances to share
+        one connection pool between them.
+        """
+        mounts = {
+            f"https://{host}": cls._create_transport(limits=cls.HOST_POOL_LIMITS, retries=3)
+            for host in cls.HOSTS
+        }
+        return httpx.AsyncClient(
+            timeout=cls.TIMEOUT,
+            limits=cls.POOL_LIMITS,
+            http2=True,
+            headers={"Accept-Encoding": "gzip, br, deflate"},
+            mounts=mounts,
+        )
+
+    @staticmethod
+    def _create_transport(**kwargs: Any) -> httpx.AsyncBaseTransport:
+        """Create a pooled transport for one ADO host.
+
+        Set ``AZURE_DEVOPS_HTTP_BACKEND=aiohttp`` (with the ``aiohttp`` extra
+        installed) to pool connections with aiohttp instead of httpcore, which
+        contends less on its pool lock under bursts of concurrent requests but
+        speaks HTTP/1.1 only.
+        """
+        if os.environ.get("AZURE_DEVOPS_HTTP_BACKEND") == "aiohttp":
+            # Imported lazily so the default backend never loads aiohttp
+            from httpx_aiohttp import AiohttpTransport
+
+            return AiohttpTransport(**kwargs)
+        return httpx.AsyncHTTPTransport(http2=True, **kwargs)
+
+    async def warm_up(self, *hosts: str) -> None:
+        """Open pooled connections to ADO hosts ahead of the first real call.
+
+        DNS lookups and TLS handshakes for all hosts run concurrently instead
+        of being paid serially by the first request to each host.
+
+        Args:
+            hosts: Hostnames to connect to. Defaults to every ADO host.
+        """
+        await self.preconnect(await self._get_client(), *hosts)
+
+    @classmethod
+    async def preconnect(cls, http: httpx.AsyncClient, *hosts: str) -> None:
+        """Open connections to ADO hosts on an HTTP client without authenticating.
+
+        Use it on a shared client from ``create_http_client`` at startup, before
+        any AzureDevOpsClient exists. Unreachable hosts are ignored.
+
+        Args:
+            http: HTTP client whose pool should hold the connections.
+            hosts: Hostnames to connect to. Defaults to every ADO host.
+        """
+
+        async def connect(host: str) -> None:
+            try:
+                await http.head(f"https://{host}/")
+            except httpx.HTTPError:
+                pass
+
+        await asyncio.gather(*(connect(host) for host in hosts or cls.HOSTS))
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        if self._client and not self._client.is_closed:
+        """Close the HTTP client, unless it was shared in through ``http``.
+
+        Background OAuth refreshes for this client's credentials stop too.
+        """
+        self.auth.close()
+        if self._owns_client and self._client and not self._client.is_closed:
             await self._client.aclose()
 
+    async def aclose(self) -> None:
+        """Close the HTTP client (alias of close, matching httpx)."""
+        await self.close()
+
+    async def __aenter__(self) -> "AzureDevOpsClient":
+        """Open the connection pool for use in an ``async with`` block."""
+        await self._get_client()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Close the connection pool, even if the block raised."""
+        await self.close()
+
+    async def parallel(self, *coros: Awaitable[Any]) -> list[Any]:
+        """Run independent API calls concurrently over the shared connection pool.
+
+        Example:
+            repos, defs = await client.parallel(
+                client.list_repositories(project),
+                client.list_build_definitions(project),
+            )
+        """
+        return list(await asyncio.gather(*coros))
+
+    async def _get_auth_headers(self) -> Mapping[str, str]:
+        """Get auth headers, reusing them until the underlying credential expires."""
+        headers = self._auth_headers
+        if headers is not None and time.monotonic() < self._auth_expires_at:
+            return headers
+
+        headers = await self.auth.get_headers_async()
+        self._auth_headers = headers
+        self._auth_expires_at = self.auth.headers_expire_at()
+        return headers
+
+    def _request_slot(self) -> asyncio.Semaphore:
+        """Get the organization's request semaphore for the running loop."""
+        slots = self._slots
+        loop = asyncio.get_running_loop()
+        if slots is None or slots[0] is not loop:
+            slots = self._slots = (
+                loop,
+                _request_slots(self._organization, self.MAX_CONCURRENT_REQUESTS),
+            )
+        return slots[1]
+
+    def invalidate_auth(self) -> None:
+        """Forget cached auth headers, e.g. after the API rejected them."""
+        self._auth_headers = None
+        self._auth_expires_at = 0.0
+        self.auth.invalidate_token()
+
     async def _request(
         self,
         method: str,
         url: str,
         params: Optional[dict[str, Any]] = None,
-        json: Optional[dict[str, Any]] = None,
+        json: Optional[Any] = None,
         headers: Optional[dict[str, str]] = None,
+        json_bytes: Optional[bytes] = None,
+        validate_as: Optional[Any] = None,
+        model_list: Optional[Any] = None,
     ) -> Any:
         """Make an authenticated request to Azure DevOps API.
 
@@ -76,56 +516,325 @@ class AzureDevOpsClient:
             params: Query parameters.
             json: JSON body for POST/PUT/PATCH requests.
             headers: Additional headers.
+            json_bytes: Already serialized JSON body, used instead of json.
+            validate_as: Model or type (e.g. ListResponse[Build]) to validate
+                the raw response bytes into. Tool results that are passed
+                straight back to MCP clients should leave this unset.
+            model_list: Model to validate the items of a {count, value} list
+                response into; the items are returned as a list.
 
         Returns:
-            Parsed JSON response.
+            Parsed JSON response, or an instance of validate_as, or a list of
+            model_list instances.
+
+        Raises:
+            AzureDevOpsClientError: If the request fails.
+        """
+        response = await self._send(
+            method, url, params=params, json=json, headers=headers, json_bytes=json_bytes
+        )
+        if response.status_code == 204:
+            return None
+
+        content = response.content
+        if model_list is not None:
+            from .models import list_adapter
+
+            return list_adapter(model_list).validate_json(content).value
+        if validate_as is not None:
+            from .models import adapter
+
+            return adapter(validate_as).validate_json(content)
+        return orjson.loads(content) if content else None
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[dict[str, Any]] = None,
+        json: Optional[Any] = None,
+        headers: Optional[dict[str, str]] = None,
+        json_bytes: Optional[bytes] = None,
+    ) -> httpx.Response:
+        """Send an authenticated request and return the successful response.
+
+        Throttled requests are retried, and 503s are retried for idempotent
+        methods only; any other error status is raised.
 
         Raises:
             AzureDevOpsClientError: If the request fails.
         """
         client = await self._get_client()
-        auth_headers = await self.auth.get_headers_async()
+        auth_headers = await self._get_auth_headers()
 
-        request_headers = {
-            **auth_headers,
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
         if headers:
-            request_headers.update(headers)
+            request_headers = {**auth_headers, **self._STATIC_HEADERS, **headers}
+        else:
+            request_headers = {**auth_headers, **self._STATIC_HEADERS}
+
+        # Add API version to params, letting callers override it
+        params = {**self._DEFAULT_PARAMS, **params} if params else self._DEFAULT_PARAMS
+
+        content = json_bytes
+        if content is None and json is not None:
+            content = orjson.dumps(json)
 
-        # Add API version to params
-        params = params or {}
-        if "api-version" not in params:
-            params["api-version"] = self.API_VERSION
+        if method.upper() in self.IDEMPOTENT_METHODS:
+            retry_statuses = self.RETRY_STATUSES
+        else:
+            retry_statuses = self.WRITE_RETRY_STATUSES
 
+        slot = self._request_slot()
         try:
-            response = await client.request(
-                method=method,
-                url=url,
-                params=params,
-                json=json,
-                headers=request_headers,
+            for attempt in range(self.MAX_RETRIES + 1):
+                # Hold a slot only while the request is on the wire, not
+                # during the retry backoff below
+                async with slot:
+                    response = await client.request(
+                        method=method,
+                        url=url,
+                        params=params,
+                        content=content,
+                        headers=request_headers,
+                    )
+                if (
+                    response.status_code not in retry_statuses
+                    or attempt == self.MAX_RETRIES
+                ):
+                    break
+                await asyncio.sleep(self._retry_delay(response, attempt))
+        except httpx.RequestError as e:
+            raise AzureDevOpsClientError(f"Request failed: {str(e)}") from e
+
+        status_code = response.status_code
+        if status_code >= 400:
+            # Only 401 means the credential was rejected; a 403 is a
+            # permission failure that a fresh token would not fix
+            if status_code == 401:
+                self.invalidate_auth()
+            raise AzureDevOpsClientError(
+                f"Azure DevOps API error: {status_code} - {_error_message(response.content)}",
+                status_code,
             )
-            response.raise_for_status()
+        return response
 
-            if response.status_code == 204:
-                return None
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> float:
+        """Get how long to wait before retrying a throttled request."""
+        retry_after = response.headers.get("Retry-After")
+        try:
+            delay = float(retry_after) if retry_after else None
+        except ValueError:
+            delay = None
+        if delay is None:
+            delay = self.RETRY_BACKOFF * (2**attempt)
+        return min(delay, self.MAX_RETRY_DELAY) + random.random() * 0.1
+
+    async def _cached_get(
+        self,
+        url: str,
+        ttl: float,
+        params: Optional[dict[str, Any]] = None,
+    ) -> Any:
+        """GET a URL through the bounded TTL response cache.
 
-            return response.json()
+        The raw response bytes are cached and decoded afresh on every hit,
+        so callers can mutate the result freely without a deep copy.
+        """
+        key = f"{url}?{urlencode(sorted(params.items()))}" if params else url
+        return await self._cached_send(key, ttl, "GET", url, params=params)
 
-        except httpx.HTTPStatusError as e:
-            error_msg = f"Azure DevOps API error: {e.response.status_code}"
-            try:
-                error_body = e.response.json()
-                if "message" in error_body:
-                    error_msg = f"{error_msg} - {error_body['message']}"
-            except Exception:
-                error_msg = f"{error_msg} - {e.response.text}"
-            raise AzureDevOpsClientError(error_msg, e.response.status_code) from e
+    async def _cached_send(
+        self,
+        key: str,
+        ttl: float,
+        method: str,
+        url: str,
+        params: Optional[dict[str, Any]] = None,
+        json_bytes: Optional[bytes] = None,
+        disk_ttl: float = 0.0,
+        disk_tag: Optional[str] = None,
+    ) -> Any:
+        """Send an idempotent request through the TTL response cache.
 
-        except httpx.RequestError as e:
-            raise AzureDevOpsClientError(f"Request failed: {str(e)}") from e
+        Concurrent misses for the same key share one request instead of each
+        going to the network.
+
+        Args:
+            key: Cache key; must start with the URL so invalidate() finds it.
+            ttl: Seconds to keep the response; 0 or less skips the cache.
+            method: HTTP method.
+            url: Full URL.
+            params: Query parameters.
+            json_bytes: Already serialized JSON body.
+            disk_ttl: Seconds to keep the response in the on-disk cache, when
+                one is enabled; 0 keeps it in memory only.
+            disk_tag: invalidate() prefix that evicts the on-disk entry.
+        """
+        if ttl <= 0:
+            response = await self._send(method, url, params=params, json_bytes=json_bytes)
+            raw = response.content
+            return orjson.loads(raw) if raw else None
+
+        entry = self._cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._cache.move_to_end(key)
+            return orjson.loads(entry[1]) if entry[1] else None
+
+        # diskcache does blocking SQLite and file I/O, so keep it off the loop
+        raw = None
+        if disk_ttl > 0 and self._disk is not None:
+            generation = self._generation
+            raw = await asyncio.to_thread(self._disk.get, f"{self._disk_namespace}:{key}")
+            if raw is not None and generation == self._generation:
+                self._store(key, ttl, raw)
+        if raw is None:
+            pending = self._inflight.get(key)
+            if pending is None:
+                pending = asyncio.ensure_future(
+                    self._fill_cache(
+                        key, ttl, method, url, params, json_bytes, disk_ttl, disk_tag
+                    )
+                )
+                self._inflight[key] = pending
+                pending.add_done_callback(functools.partial(self._forget_inflight, key))
+            # Shielded so one cancelled caller does not fail the others
+            raw = await asyncio.shield(pending)
+        return orjson.loads(raw) if raw else None
+
+    async def _fill_cache(
+        self,
+        key: str,
+        ttl: float,
+        method: str,
+        url: str,
+        params: Optional[dict[str, Any]],
+        json_bytes: Optional[bytes],
+        disk_ttl: float = 0.0,
+        disk_tag: Optional[str] = None,
+    ) -> bytes:
+        """Fetch a response and store its raw bytes under key."""
+        generation = self._generation
+        response = await self._send(method, url, params=params, json_bytes=json_bytes)
+        raw = response.content
+        if generation != self._generation:
+            return raw
+        self._store(key, ttl, raw)
+        if disk_ttl > 0 and self._disk is not None:
+            await asyncio.to_thread(
+                self._disk.set,
+                f"{self._disk_namespace}:{key}",
+                raw,
+                expire=disk_ttl,
+                tag=disk_tag,
+            )
+        return raw
+
+    def _forget_inflight(self, key: str, future: "asyncio.Future[bytes]") -> None:
+        """Drop a finished fetch from the in-flight table, unless it was replaced."""
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+
+    def _store(self, key: str, ttl: float, raw: bytes) -> None:
+        """Put raw response bytes in the in-memory cache, evicting the oldest."""
+        self._cache[key] = (time.monotonic() + ttl, raw)
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.CACHE_MAX_ENTRIES:
+            self._cache.popitem(last=False)
+
+    async def invalidate(self, prefix: str = "") -> None:
+        """Drop cached responses whose URL starts with prefix (all by default).
+
+        On-disk entries are evicted by the tag they were stored under, so only
+        a project prefix (see _invalidate_project) reaches them. Fetches still
+        in flight are not cached when they complete, and later reads start a
+        fresh fetch instead of joining them.
+        """
+        if not prefix:
+            self._generation += 1
+            self._cache.clear()
+            self._inflight.clear()
+            return
+        # Disk first, so a read racing the eviction cannot refill memory from it
+        if self._disk is not None:
+            await asyncio.to_thread(self._disk.evict, prefix)
+        self._evict_memory(prefix)
+
+    def _evict_memory(self, prefix: str) -> None:
+        """Drop in-memory and in-flight responses whose key starts with prefix."""
+        self._generation += 1
+        for key in [k for k in self._cache if k.startswith(prefix)]:
+            del self._cache[key]
+        for key in [k for k in self._inflight if k.startswith(prefix)]:
+            del self._inflight[key]
+
+    async def _invalidate_project(self, project: str) -> None:
+        """Drop cached responses scoped to a project after it was modified.
+
+        Besides the project's own URLs this covers the organization-level
+        project and team lookups (get_project, list_teams).
+        """
+        await self.invalidate(f"{self._pbase(project)}/")
+        self._evict_memory(f"{self._base}/_apis/projects/{_quote(project)}")
+
+    async def _list_all_by_skip(
+        self,
+        fetch: Callable[[int, int], Awaitable[dict[str, Any]]],
+        page_size: int,
+        max_concurrency: int,
+    ) -> list[Any]:
+        """Collect every page of a $top/$skip endpoint.
+
+        The first page is fetched alone, so a listing that fits in one page
+        costs one request. If it is full, the following pages are requested
+        in windows of max_concurrency, and the first short page ends the
+        listing. Pages in a window after a short page are discarded.
+
+        Args:
+            fetch: Coroutine function taking (top, skip) and returning a page.
+            page_size: Items requested per page.
+            max_concurrency: Pages requested concurrently per window.
+
+        Raises:
+            AzureDevOpsClientError: If the listing runs past MAX_LIST_PAGES
+                pages, e.g. because the server never returns a short page.
+        """
+        items = list((await fetch(page_size, 0)).get("value", []))
+        if len(items) < page_size:
+            return items
+
+        window = max(1, max_concurrency)
+        page = 1
+        while page < self.MAX_LIST_PAGES:
+            count = min(window, self.MAX_LIST_PAGES - page)
+            pages = await asyncio.gather(
+                *(fetch(page_size, (page + i) * page_size) for i in range(count))
+            )
+            for result in pages:
+                value = result.get("value", [])
+                items.extend(value)
+                if len(value) < page_size:
+                    return items
+            page += count
+        raise AzureDevOpsClientError(
+            f"Listing exceeded {self.MAX_LIST_PAGES} pages of {page_size} items"
+        )
+
+    async def _list_all_by_token(
+        self,
+        fetch: Callable[[Optional[str]], Awaitable[dict[str, Any]]],
+    ) -> list[Any]:
+        """Collect every page of an endpoint paged by continuation token.
+
+        Each page names the next one, so pages are necessarily fetched in turn.
+        """
+        items: list[Any] = []
+        token: Optional[str] = None
+        while True:
+            page = await fetch(token)
+            items.extend(page.get("value", []))
+            token = page.get("continuationToken")
+            if not token:
+                return items
 
     # ==================== Core API ====================
 
@@ -142,13 +851,13 @@ class AzureDevOpsClient:
         if skip:
             params["$skip"] = skip
 
-        url = f"{self.base_url}/_apis/projects"
-        return await self._request("GET", url, params=params)
+        url = f"{self._base}/_apis/projects"
+        return await self._cached_get(url, self.CACHE_TTL_LIST, params=params)
 
     async def get_project(self, project: str) -> dict[str, Any]:
         """Get a specific project by name or ID."""
-        url = f"{self.base_url}/_apis/projects/{quote(project)}"
-        return await self._request("GET", url)
+        url = f"{self._base}/_apis/projects/{_quote(project)}"
+        return await self._cached_get(url, self.CACHE_TTL_GET)
 
     async def list_teams(
         self,
@@ -163,8 +872,8 @@ class AzureDevOpsClient:
         if skip:
             params["$skip"] = skip
 
-        url = f"{self.base_url}/_apis/projects/{quote(project)}/teams"
-        return await self._request("GET", url, params=params)
+        url = f"{self._base}/_apis/projects/{_quote(project)}/teams"
+        return await self._cached_get(url, self.CACHE_TTL_LIST, params=params)
 
     async def get_identities(
         self,
@@ -176,7 +885,7 @@ class AzureDevOpsClient:
             "searchFilter": search_filter,
             "filterValue": filter_value,
         }
-        url = f"{self.vssps_url}/_apis/identities"
+        url = f"{self._vssps}/_apis/identities"
         return await self._request("GET", url, params=params)
 
     # ==================== Work Items API ====================
@@ -195,7 +904,7 @@ class AzureDevOpsClient:
         if fields:
             params["fields"] = ",".join(fields)
 
-        url = f"{self.base_url}/{quote(project)}/_apis/wit/workitems/{work_item_id}"
+        url = f"{self._pbase(project)}/_apis/wit/workitems/{work_item_id}"
         return await self._request("GET", url, params=params)
 
     async def get_work_items_batch(
@@ -212,37 +921,68 @@ class AzureDevOpsClient:
         if expand:
             body["$expand"] = expand
 
-        url = f"{self.base_url}/{quote(project)}/_apis/wit/workitemsbatch"
+        url = f"{self._pbase(project)}/_apis/wit/workitemsbatch"
         return await self._request("POST", url, json=body)
 
+    async def get_work_items(
+        self,
+        project: str,
+        ids: list[int],
+        fields: Optional[list[str]] = None,
+        expand: Optional[str] = None,
+        chunk_size: int = WORK_ITEMS_BATCH_SIZE,
+    ) -> list[dict[str, Any]]:
+        """Get any number of work items, batching the IDs behind the scenes.
+
+        Prefer this over calling get_work_item in a loop: IDs are split into
+        batches of up to 200 (the API limit) which are fetched concurrently,
+        so N work items cost ceil(N / 200) round trips.
+        """
+        batches = [ids[i : i + chunk_size] for i in range(0, len(ids), chunk_size)]
+        results = await asyncio.gather(
+            *(
+                self.get_work_items_batch(project, batch, fields=fields, expand=expand)
+                for batch in batches
+            )
+        )
+        return list(itertools.chain.from_iterable(r.get("value", []) for r in results))
+
+    @_invalidates_project
     async def create_work_item(
         self,
         project: str,
         work_item_type: str,
-        document: list[dict[str, Any]],
+        document: Union[list[dict[str, Any]], bytes],
     ) -> dict[str, Any]:
-        """Create a new work item."""
-        url = f"{self.base_url}/{quote(project)}/_apis/wit/workitems/${quote(work_item_type)}"
+        """Create a new work item.
+
+        The document may be pre-serialized with serialize_patch.
+        """
+        url = f"{self._pbase(project)}/_apis/wit/workitems/${_safe_id(work_item_type)}"
         return await self._request(
             "POST",
             url,
-            json=document,
-            headers={"Content-Type": "application/json-patch+json"},
+            **_patch_body(document),
+            headers=_JSON_PATCH_HEADERS,
         )
 
+    @_invalidates_project
     async def update_work_item(
         self,
         project: str,
         work_item_id: int,
-        document: list[dict[str, Any]],
+        document: Union[list[dict[str, Any]], bytes],
     ) -> dict[str, Any]:
-        """Update an existing work item."""
-        url = f"{self.base_url}/{quote(project)}/_apis/wit/workitems/{work_item_id}"
+        """Update an existing work item.
+
+        The document may be pre-serialized with serialize_patch.
+        """
+        url = f"{self._pbase(project)}/_apis/wit/workitems/{work_item_id}"
         return await self._request(
             "PATCH",
             url,
-            json=document,
-            headers={"Content-Type": "application/json-patch+json"},
+            **_patch_body(document),
+            headers=_JSON_PATCH_HEADERS,
         )
 
     async def list_work_item_comments(
@@ -250,15 +990,31 @@ class AzureDevOpsClient:
         project: str,
         work_item_id: int,
         top: Optional[int] = None,
+        continuation_token: Optional[str] = None,
     ) -> dict[str, Any]:
         """List comments on a work item."""
         params: dict[str, Any] = {}
         if top:
             params["$top"] = top
+        if continuation_token:
+            params["continuationToken"] = continuation_token
 
-        url = f"{self.base_url}/{quote(project)}/_apis/wit/workitems/{work_item_id}/comments"
+        url = f"{self._pbase(project)}/_apis/wit/workitems/{work_item_id}/comments"
         return await self._request("GET", url, params=params)
 
+    async def list_all_work_item_comments(
+        self,
+        project: str,
+        work_item_id: int,
+        page_size: int = 200,
+    ) -> list[dict[str, Any]]:
+        """List every comment on a work item, following continuation tokens."""
+        return await self._list_all_by_token(
+            lambda token: self.list_work_item_comments(
+                project, work_item_id, top=page_size, continuation_token=token
+            )
+        )
+
     async def add_work_item_comment(
         self,
         project: str,
@@ -266,7 +1022,7 @@ class AzureDevOpsClient:
         text: str,
     ) -> dict[str, Any]:
         """Add a comment to a work item."""
-        url = f"{self.base_url}/{quote(project)}/_apis/wit/workitems/{work_item_id}/comments"
+        url = f"{self._pbase(project)}/_apis/wit/workitems/{work_item_id}/comments"
         return await self._request("POST", url, json={"text": text})
 
     async def run_wiql_query(
@@ -280,7 +1036,7 @@ class AzureDevOpsClient:
         if top:
             params["$top"] = top
 
-        url = f"{self.base_url}/{quote(project)}/_apis/wit/wiql"
+        url = f"{self._pbase(project)}/_apis/wit/wiql"
         return await self._request("POST", url, json={"query": query}, params=params)
 
     async def get_query(
@@ -295,7 +1051,7 @@ class AzureDevOpsClient:
         if expand:
             params["$expand"] = expand
 
-        url = f"{self.base_url}/{quote(project)}/_apis/wit/queries/{quote(query_id)}"
+        url = f"{self._pbase(project)}/_apis/wit/queries/{quote(query_id)}"
         return await self._request("GET", url, params=params)
 
     async def list_backlogs(
@@ -304,7 +1060,7 @@ class AzureDevOpsClient:
         team: str,
     ) -> dict[str, Any]:
         """List backlogs for a team."""
-        url = f"{self.base_url}/{quote(project)}/{quote(team)}/_apis/work/backlogs"
+        url = f"{self._team_base(project, team)}/_apis/work/backlogs"
         return await self._request("GET", url)
 
     async def get_backlog_work_items(
@@ -314,7 +1070,7 @@ class AzureDevOpsClient:
         backlog_id: str,
     ) -> dict[str, Any]:
         """Get work items in a backlog."""
-        url = f"{self.base_url}/{quote(project)}/{quote(team)}/_apis/work/backlogs/{quote(backlog_id)}/workItems"
+        url = f"{self._team_base(project, team)}/_apis/work/backlogs/{_safe_id(backlog_id)}/workItems"
         return await self._request("GET", url)
 
     # ==================== Git Repositories API ====================
@@ -324,8 +1080,8 @@ class AzureDevOpsClient:
         project: str,
     ) -> dict[str, Any]:
         """List repositories in a project."""
-        url = f"{self.base_url}/{quote(project)}/_apis/git/repositories"
-        return await self._request("GET", url)
+        url = f"{self._pbase(project)}/_apis/git/repositories"
+        return await self._cached_get(url, self.CACHE_TTL_LIST)
 
     async def get_repository(
         self,
@@ -333,8 +1089,8 @@ class AzureDevOpsClient:
         repository_id: str,
     ) -> dict[str, Any]:
         """Get a specific repository."""
-        url = f"{self.base_url}/{quote(project)}/_apis/git/repositories/{quote(repository_id)}"
-        return await self._request("GET", url)
+        url = f"{self._pbase(project)}/_apis/git/repositories/{_safe_id(repository_id)}"
+        return await self._cached_get(url, self.CACHE_TTL_GET)
 
     async def list_branches(
         self,
@@ -350,9 +1106,10 @@ class AzureDevOpsClient:
         if top:
             params["$top"] = top
 
-        url = f"{self.base_url}/{quote(project)}/_apis/git/repositories/{quote(repository_id)}/refs"
+        url = f"{self._pbase(project)}/_apis/git/repositories/{_safe_id(repository_id)}/refs"
         return await self._request("GET", url, params=params)
 
+    @_invalidates_project
     async def create_branch(
         self,
         project: str,
@@ -362,7 +1119,7 @@ class AzureDevOpsClient:
     ) -> dict[str, Any]:
         """Create a new branch."""
         # First get the source commit
-        refs_url = f"{self.base_url}/{quote(project)}/_apis/git/repositories/{quote(repository_id)}/refs"
+        refs_url = f"{self._pbase(project)}/_apis/git/repositories/{_safe_id(repository_id)}/refs"
         refs_params = {"filter": f"heads/{source_ref}"}
         source_refs = await self._request("GET", refs_url, params=refs_params)
 
@@ -407,9 +1164,29 @@ class AzureDevOpsClient:
         if to_date:
             params["searchCriteria.toDate"] = to_date
 
-        url = f"{self.base_url}/{quote(project)}/_apis/git/repositories/{quote(repository_id)}/commits"
+        url = f"{self._pbase(project)}/_apis/git/repositories/{_safe_id(repository_id)}/commits"
         return await self._request("GET", url, params=params)
 
+    async def list_all_commits(
+        self,
+        project: str,
+        repository_id: str,
+        page_size: int = 100,
+        max_concurrency: int = 10,
+        **filters: Any,
+    ) -> list[dict[str, Any]]:
+        """List every commit matching the filters accepted by list_commits.
+
+        Pages after the first are fetched max_concurrency at a time.
+        """
+        return await self._list_all_by_skip(
+            lambda top, skip: self.list_commits(
+                project, repository_id, top=top, skip=skip, **filters
+            ),
+            page_size,
+            max_concurrency,
+        )
+
     async def get_commit(
         self,
         project: str,
@@ -417,7 +1194,7 @@ class AzureDevOpsClient:
         commit_id: str,
     ) -> dict[str, Any]:
         """Get a specific commit."""
-        url = f"{self.base_url}/{quote(project)}/_apis/git/repositories/{quote(repository_id)}/commits/{quote(commit_id)}"
+        url = f"{self._pbase(project)}/_apis/git/repositories/{_safe_id(repository_id)}/commits/{_safe_id(commit_id)}"
         return await self._request("GET", url)
 
     # ==================== Pull Requests API ====================
@@ -451,9 +1228,29 @@ class AzureDevOpsClient:
         if target_ref_name:
             params["searchCriteria.targetRefName"] = target_ref_name
 
-        url = f"{self.base_url}/{quote(project)}/_apis/git/repositories/{quote(repository_id)}/pullrequests"
+        url = f"{self._pbase(project)}/_apis/git/repositories/{_safe_id(repository_id)}/pullrequests"
         return await self._request("GET", url, params=params)
 
+    async def list_all_pull_requests(
+        self,
+        project: str,
+        repository_id: str,
+        page_size: int = 100,
+        max_concurrency: int = 10,
+        **filters: Any,
+    ) -> list[dict[str, Any]]:
+        """List every pull request matching the filters accepted by list_pull_requests.
+
+        Pages after the first are fetched max_concurrency at a time.
+        """
+        return await self._list_all_by_skip(
+            lambda top, skip: self.list_pull_requests(
+                project, repository_id, top=top, skip=skip, **filters
+            ),
+            page_size,
+            max_concurrency,
+        )
+
     async def get_pull_request(
         self,
         project: str,
@@ -461,9 +1258,10 @@ class AzureDevOpsClient:
         pull_request_id: int,
     ) -> dict[str, Any]:
         """Get a specific pull request."""
-        url = f"{self.base_url}/{quote(project)}/_apis/git/repositories/{quote(repository_id)}/pullrequests/{pull_request_id}"
+        url = f"{self._pbase(project)}/_apis/git/repositories/{_safe_id(repository_id)}/pullrequests/{pull_request_id}"
         return await self._request("GET", url)
 
+    @_invalidates_project
     async def create_pull_request(
         self,
         project: str,
@@ -484,9 +1282,10 @@ class AzureDevOpsClient:
         if description:
             body["description"] = description
 
-        url = f"{self.base_url}/{quote(project)}/_apis/git/repositories/{quote(repository_id)}/pullrequests"
+        url = f"{self._pbase(project)}/_apis/git/repositories/{_safe_id(repository_id)}/pullrequests"
         return await self._request("POST", url, json=body)
 
+    @_invalidates_project
     async def update_pull_request(
         self,
         project: str,
@@ -495,7 +1294,7 @@ class AzureDevOpsClient:
         updates: dict[str, Any],
     ) -> dict[str, Any]:
         """Update a pull request."""
-        url = f"{self.base_url}/{quote(project)}/_apis/git/repositories/{quote(repository_id)}/pullrequests/{pull_request_id}"
+        url = f"{self._pbase(project)}/_apis/git/repositories/{_safe_id(repository_id)}/pullrequests/{pull_request_id}"
         return await self._request("PATCH", url, json=updates)
 
     async def list_pull_request_threads(
@@ -505,9 +1304,10 @@ class AzureDevOpsClient:
         pull_request_id: int,
     ) -> dict[str, Any]:
         """List comment threads on a pull request."""
-        url = f"{self.base_url}/{quote(project)}/_apis/git/repositories/{quote(repository_id)}/pullrequests/{pull_request_id}/threads"
+        url = f"{self._pbase(project)}/_apis/git/repositories/{_safe_id(repository_id)}/pullrequests/{pull_request_id}/threads"
         return await self._request("GET", url)
 
+    @_invalidates_project
     async def create_pull_request_thread(
         self,
         project: str,
@@ -538,7 +1338,7 @@ class AzureDevOpsClient:
                     "offset": 1,
                 }
 
-        url = f"{self.base_url}/{quote(project)}/_apis/git/repositories/{quote(repository_id)}/pullrequests/{pull_request_id}/threads"
+        url = f"{self._pbase(project)}/_apis/git/repositories/{_safe_id(repository_id)}/pullrequests/{pull_request_id}/threads"
         return await self._request("POST", url, json=body)
 
     async def reply_to_thread(
@@ -552,7 +1352,7 @@ class AzureDevOpsClient:
         """Reply to a comment thread."""
         body = {"content": content, "commentType": 1}
 
-        url = f"{self.base_url}/{quote(project)}/_apis/git/repositories/{quote(repository_id)}/pullrequests/{pull_request_id}/threads/{thread_id}/comments"
+        url = f"{self._pbase(project)}/_apis/git/repositories/{_safe_id(repository_id)}/pullrequests/{pull_request_id}/threads/{thread_id}/comments"
         return await self._request("POST", url, json=body)
 
     # ==================== Pipelines API ====================
@@ -573,7 +1373,7 @@ class AzureDevOpsClient:
         if top:
             params["$top"] = top
 
-        url = f"{self.base_url}/{quote(project)}/_apis/build/definitions"
+        url = f"{self._pbase(project)}/_apis/build/definitions"
         return await self._request("GET", url, params=params)
 
     async def get_build_definition(
@@ -582,8 +1382,8 @@ class AzureDevOpsClient:
         definition_id: int,
     ) -> dict[str, Any]:
         """Get a build definition."""
-        url = f"{self.base_url}/{quote(project)}/_apis/build/definitions/{definition_id}"
-        return await self._request("GET", url)
+        url = f"{self._pbase(project)}/_apis/build/definitions/{definition_id}"
+        return await self._cached_get(url, self.CACHE_TTL_GET)
 
     async def list_builds(
         self,
@@ -594,8 +1394,13 @@ class AzureDevOpsClient:
         result: Optional[str] = None,
         top: Optional[int] = None,
         requested_for: Optional[str] = None,
+        continuation_token: Optional[str] = None,
     ) -> dict[str, Any]:
-        """List builds."""
+        """List builds.
+
+        When more builds are available the response carries a
+        continuationToken to pass back for the next page.
+        """
         params: dict[str, Any] = {}
         if definitions:
             params["definitions"] = ",".join(str(d) for d in definitions)
@@ -609,9 +1414,30 @@ class AzureDevOpsClient:
             params["$top"] = top
         if requested_for:
             params["requestedFor"] = requested_for
-
-        url = f"{self.base_url}/{quote(project)}/_apis/build/builds"
-        return await self._request("GET", url, params=params)
+        if continuation_token:
+            params["continuationToken"] = continuation_token
+
+        url = f"{self._pbase(project)}/_apis/build/builds"
+        response = await self._send("GET", url, params=params)
+        builds = orjson.loads(response.content)
+        # The builds API returns its continuation token as a header
+        token = response.headers.get("x-ms-continuationtoken")
+        if token:
+            builds["continuationToken"] = token
+        return builds
+
+    async def list_all_builds(
+        self,
+        project: str,
+        page_size: int = 100,
+        **filters: Any,
+    ) -> list[dict[str, Any]]:
+        """List every build matching the filters accepted by list_builds."""
+        return await self._list_all_by_token(
+            lambda token: self.list_builds(
+                project, top=page_size, continuation_token=token, **filters
+            )
+        )
 
     async def get_build(
         self,
@@ -619,7 +1445,7 @@ class AzureDevOpsClient:
         build_id: int,
     ) -> dict[str, Any]:
         """Get a specific build."""
-        url = f"{self.base_url}/{quote(project)}/_apis/build/builds/{build_id}"
+        url = f"{self._pbase(project)}/_apis/build/builds/{build_id}"
         return await self._request("GET", url)
 
     async def queue_build(
@@ -636,11 +1462,10 @@ class AzureDevOpsClient:
         if source_branch:
             body["sourceBranch"] = source_branch
         if parameters:
-            import json
+            # The API expects parameters as a JSON string inside the body
+            body["parameters"] = orjson.dumps(parameters).decode()
 
-            body["parameters"] = json.dumps(parameters)
-
-        url = f"{self.base_url}/{quote(project)}/_apis/build/builds"
+        url = f"{self._pbase(project)}/_apis/build/builds"
         return await self._request("POST", url, json=body)
 
     async def get_build_logs(
@@ -649,7 +1474,7 @@ class AzureDevOpsClient:
         build_id: int,
     ) -> dict[str, Any]:
         """Get build logs list."""
-        url = f"{self.base_url}/{quote(project)}/_apis/build/builds/{build_id}/logs"
+        url = f"{self._pbase(project)}/_apis/build/builds/{build_id}/logs"
         return await self._request("GET", url)
 
     async def get_build_log(
@@ -661,23 +1486,59 @@ class AzureDevOpsClient:
         end_line: Optional[int] = None,
     ) -> str:
         """Get a specific build log content."""
-        params: dict[str, Any] = {}
+        chunks = [
+            chunk
+            async for chunk in self.stream_build_log(
+                project, build_id, log_id, start_line=start_line, end_line=end_line
+            )
+        ]
+        return "".join(chunks)
+
+    async def stream_build_log(
+        self,
+        project: str,
+        build_id: int,
+        log_id: int,
+        start_line: Optional[int] = None,
+        end_line: Optional[int] = None,
+        chunk_size: int = 65536,
+    ) -> AsyncIterator[str]:
+        """Stream a build log as decoded text chunks.
+
+        Pipeline logs can run to many megabytes, so the body is decoded
+        incrementally instead of being buffered in full.
+
+        Raises:
+            AzureDevOpsClientError: If the request fails.
+        """
+        params: dict[str, Any] = {"api-version": self.API_VERSION}
         if start_line:
             params["startLine"] = start_line
         if end_line:
             params["endLine"] = end_line
 
-        url = f"{self.base_url}/{quote(project)}/_apis/build/builds/{build_id}/logs/{log_id}"
+        url = f"{self._pbase(project)}/_apis/build/builds/{build_id}/logs/{log_id}"
         client = await self._get_client()
-        auth_headers = await self.auth.get_headers_async()
+        auth_headers = await self._get_auth_headers()
 
-        response = await client.get(
-            url,
-            params={**params, "api-version": self.API_VERSION},
-            headers=auth_headers,
-        )
-        response.raise_for_status()
-        return response.text
+        # The slot is held for the whole stream, since the body is still
+        # being read from the connection while chunks are yielded
+        try:
+            async with self._request_slot(), client.stream(
+                "GET", url, params=params, headers=auth_headers
+            ) as response:
+                if response.status_code >= 400:
+                    await response.aread()
+                    if response.status_code == 401:
+                        self.invalidate_auth()
+                    raise AzureDevOpsClientError(
+                        f"Azure DevOps API error: {response.status_code} - {_error_message(response.content)}",
+                        response.status_code,
+                    )
+                async for chunk in response.aiter_text(chunk_size=chunk_size):
+                    yield chunk
+        except httpx.RequestError as e:
+            raise AzureDevOpsClientError(f"Request failed: {str(e)}") from e
 
     async def list_pipeline_runs(
         self,
@@ -685,7 +1546,7 @@ class AzureDevOpsClient:
         pipeline_id: int,
     ) -> dict[str, Any]:
         """List pipeline runs."""
-        url = f"{self.base_url}/{quote(project)}/_apis/pipelines/{pipeline_id}/runs"
+        url = f"{self._pbase(project)}/_apis/pipelines/{pipeline_id}/runs"
         return await self._request("GET", url)
 
     async def run_pipeline(
@@ -704,7 +1565,7 @@ class AzureDevOpsClient:
         if variables:
             body["variables"] = {k: {"value": v} for k, v in variables.items()}
 
-        url = f"{self.base_url}/{quote(project)}/_apis/pipelines/{pipeline_id}/runs"
+        url = f"{self._pbase(project)}/_apis/pipelines/{pipeline_id}/runs"
         return await self._request("POST", url, json=body)
 
     # ==================== Wiki API ====================
@@ -715,10 +1576,10 @@ class AzureDevOpsClient:
     ) -> dict[str, Any]:
         """List wikis."""
         if project:
-            url = f"{self.base_url}/{quote(project)}/_apis/wiki/wikis"
+            url = f"{self._pbase(project)}/_apis/wiki/wikis"
         else:
-            url = f"{self.base_url}/_apis/wiki/wikis"
-        return await self._request("GET", url)
+            url = f"{self._base}/_apis/wiki/wikis"
+        return await self._cached_get(url, self.CACHE_TTL_LIST)
 
     async def get_wiki(
         self,
@@ -726,8 +1587,8 @@ class AzureDevOpsClient:
         wiki_identifier: str,
     ) -> dict[str, Any]:
         """Get a specific wiki."""
-        url = f"{self.base_url}/{quote(project)}/_apis/wiki/wikis/{quote(wiki_identifier)}"
-        return await self._request("GET", url)
+        url = f"{self._pbase(project)}/_apis/wiki/wikis/{_safe_id(wiki_identifier)}"
+        return await self._cached_get(url, self.CACHE_TTL_GET)
 
     async def list_wiki_pages(
         self,
@@ -743,7 +1604,7 @@ class AzureDevOpsClient:
         if path:
             params["path"] = path
 
-        url = f"{self.base_url}/{quote(project)}/_apis/wiki/wikis/{quote(wiki_identifier)}/pages"
+        url = f"{self._pbase(project)}/_apis/wiki/wikis/{_safe_id(wiki_identifier)}/pages"
         return await self._request("GET", url, params=params)
 
     async def get_wiki_page(
@@ -759,9 +1620,19 @@ class AzureDevOpsClient:
             "includeContent": include_content,
         }
 
-        url = f"{self.base_url}/{quote(project)}/_apis/wiki/wikis/{quote(wiki_identifier)}/pages"
-        return await self._request("GET", url, params=params)
+        url = f"{self._pbase(project)}/_apis/wiki/wikis/{_safe_id(wiki_identifier)}/pages"
+        key = f"{url}?{urlencode(sorted(params.items()))}"
+        return await self._cached_send(
+            key,
+            self._content_ttl,
+            "GET",
+            url,
+            params=params,
+            disk_ttl=self.DISK_CACHE_TTL_WIKI,
+            disk_tag=f"{self._pbase(project)}/",
+        )
 
+    @_invalidates_project
     async def create_or_update_wiki_page(
         self,
         project: str,
@@ -776,7 +1647,7 @@ class AzureDevOpsClient:
         if version:
             headers["If-Match"] = version
 
-        url = f"{self.base_url}/{quote(project)}/_apis/wiki/wikis/{quote(wiki_identifier)}/pages"
+        url = f"{self._pbase(project)}/_apis/wiki/wikis/{_safe_id(wiki_identifier)}/pages"
         return await self._request(
             "PUT",
             url,
@@ -797,7 +1668,7 @@ class AzureDevOpsClient:
         if filter_active:
             params["filterActivePlans"] = "true"
 
-        url = f"{self.base_url}/{quote(project)}/_apis/testplan/plans"
+        url = f"{self._pbase(project)}/_apis/testplan/plans"
         return await self._request("GET", url, params=params)
 
     async def get_test_plan(
@@ -806,9 +1677,10 @@ class AzureDevOpsClient:
         plan_id: int,
     ) -> dict[str, Any]:
         """Get a test plan."""
-        url = f"{self.base_url}/{quote(project)}/_apis/testplan/plans/{plan_id}"
+        url = f"{self._pbase(project)}/_apis/testplan/plans/{plan_id}"
         return await self._request("GET", url)
 
+    @_invalidates_project
     async def create_test_plan(
         self,
         project: str,
@@ -829,7 +1701,7 @@ class AzureDevOpsClient:
         if end_date:
             body["endDate"] = end_date
 
-        url = f"{self.base_url}/{quote(project)}/_apis/testplan/plans"
+        url = f"{self._pbase(project)}/_apis/testplan/plans"
         return await self._request("POST", url, json=body)
 
     async def list_test_suites(
@@ -838,9 +1710,10 @@ class AzureDevOpsClient:
         plan_id: int,
     ) -> dict[str, Any]:
         """List test suites in a plan."""
-        url = f"{self.base_url}/{quote(project)}/_apis/testplan/Plans/{plan_id}/suites"
+        url = f"{self._pbase(project)}/_apis/testplan/Plans/{plan_id}/suites"
         return await self._request("GET", url)
 
+    @_invalidates_project
     async def create_test_suite(
         self,
         project: str,
@@ -850,7 +1723,7 @@ class AzureDevOpsClient:
     ) -> dict[str, Any]:
         """Create a test suite."""
         body = {"name": name, "parentSuite": {"id": parent_suite_id}}
-        url = f"{self.base_url}/{quote(project)}/_apis/testplan/Plans/{plan_id}/suites"
+        url = f"{self._pbase(project)}/_apis/testplan/Plans/{plan_id}/suites"
         return await self._request("POST", url, json=body)
 
     async def list_test_cases(
@@ -860,7 +1733,7 @@ class AzureDevOpsClient:
         suite_id: int,
     ) -> dict[str, Any]:
         """List test cases in a suite."""
-        url = f"{self.base_url}/{quote(project)}/_apis/testplan/Plans/{plan_id}/Suites/{suite_id}/TestCase"
+        url = f"{self._pbase(project)}/_apis/testplan/Plans/{plan_id}/Suites/{suite_id}/TestCase"
         return await self._request("GET", url)
 
     async def add_test_cases_to_suite(
@@ -872,7 +1745,7 @@ class AzureDevOpsClient:
     ) -> dict[str, Any]:
         """Add test cases to a suite."""
         body = [{"workItem": {"id": tc_id}} for tc_id in test_case_ids]
-        url = f"{self.base_url}/{quote(project)}/_apis/testplan/Plans/{plan_id}/Suites/{suite_id}/TestCase"
+        url = f"{self._pbase(project)}/_apis/testplan/Plans/{plan_id}/Suites/{suite_id}/TestCase"
         return await self._request("POST", url, json=body)
 
     async def get_test_results(
@@ -881,7 +1754,7 @@ class AzureDevOpsClient:
         run_id: int,
     ) -> dict[str, Any]:
         """Get test results for a run."""
-        url = f"{self.base_url}/{quote(project)}/_apis/test/Runs/{run_id}/results"
+        url = f"{self._pbase(project)}/_apis/test/Runs/{run_id}/results"
         return await self._request("GET", url)
 
     # ==================== Search API ====================
@@ -896,26 +1769,66 @@ class AzureDevOpsClient:
         top: int = 25,
         skip: int = 0,
     ) -> dict[str, Any]:
-        """Search code across repositories."""
-        filters: dict[str, list[str]] = {}
-        if project:
-            filters["Project"] = [project]
-        if repository:
-            filters["Repository"] = [repository]
-        if path:
-            filters["Path"] = [path]
-        if branch:
-            filters["Branch"] = [branch]
+        """Search code across repositories.
 
-        body = {
-            "searchText": search_text,
-            "$top": top,
-            "$skip": skip,
-            "filters": filters,
-        }
+        Results can run to megabytes, so they are returned as the raw dicts
+        decoded by orjson and never validated into CodeSearchResult models;
+        use models.decode for typed access. Repeated searches are served from
+        the response cache for CACHE_TTL_CONTENT (or AZURE_DEVOPS_CACHE_TTL)
+        seconds.
+        """
+        body = _search_body(search_text, project, repository, path, branch, top, skip)
+        url = f"{self._search}/_apis/search/codesearchresults"
+        key = f"{url}#{body.decode()}"
+        return await self._cached_send(
+            key,
+            self._content_ttl,
+            "POST",
+            url,
+            json_bytes=body,
+            disk_ttl=self.DISK_CACHE_TTL_SEARCH,
+        )
 
-        url = f"{self.search_url}/_apis/search/codesearchresults"
-        return await self._request("POST", url, json=body)
+    async def iter_search_code(
+        self,
+        search_text: str,
+        project: Optional[str] = None,
+        repository: Optional[str] = None,
+        path: Optional[str] = None,
+        branch: Optional[str] = None,
+        page_size: int = 100,
+        max_results: Optional[int] = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield code search hits page by page.
+
+        The search API returns one JSON document per request, so hits are
+        fetched in pages of page_size and only one page is held at a time;
+        the first hits are available after the first page arrives.
+
+        Args:
+            search_text: Text to search for.
+            project: Optional project filter.
+            repository: Optional repository filter.
+            path: Optional path filter.
+            branch: Optional branch filter.
+            page_size: Hits per request (the API allows up to 1000).
+            max_results: Stop after this many hits. Defaults to all of them.
+
+        Raises:
+            AzureDevOpsClientError: If a request fails.
+        """
+        skip = 0
+        while max_results is None or skip < max_results:
+            top = page_size if max_results is None else min(page_size, max_results - skip)
+            page = await self.search_code(
+                search_text, project, repository, path, branch, top=top, skip=skip
+            )
+            results = page.get("results") or []
+            for hit in results:
+                yield hit
+            skip += len(results)
+            if len(results) < top or skip >= page.get("count", 0):
+                return
 
     # ==================== Iterations API ====================
 
@@ -930,7 +1843,7 @@ class AzureDevOpsClient:
         if timeframe:
             params["$timeframe"] = timeframe
 
-        url = f"{self.base_url}/{quote(project)}/{quote(team)}/_apis/work/teamsettings/iterations"
+        url = self._iterations_url(project, team)
         return await self._request("GET", url, params=params)
 
     async def get_iteration(
@@ -940,6 +1853,53 @@ class AzureDevOpsClient:
         iteration_id: str,
     ) -> dict[str, Any]:
         """Get a specific iteration."""
-        url = f"{self.base_url}/{quote(project)}/{quote(team)}/_apis/work/teamsettings/iterations/{quote(iteration_id)}"
+        url = f"{self._iterations_url(project, team)}/{_safe_id(iteration_id)}"
         return await self._request("GET", url)
 
+    async def get_iterations_bulk(
+        self,
+        project: str,
+        team: str,
+        iteration_ids: list[str],
+    ) -> list[dict[str, Any]]:
+        """Get several iterations concurrently, in the order requested.
+
+        For work items use get_work_items, which batches IDs into single
+        requests instead of fanning out.
+        """
+        return list(
+            await asyncio.gather(
+                *(self.get_iteration(project, team, iteration_id) for iteration_id in iteration_ids)
+            )
+        )
+
+    async def get_iteration_work_items(
+        self,
+        project: str,
+        team: str,
+        iteration_id: str,
+    ) -> dict[str, Any]:
+        """Get the work item links for an iteration."""
+        url = f"{self._iterations_url(project, team)}/{_safe_id(iteration_id)}/workitems"
+        return await self._request("GET", url)
+
+    async def list_iterations_detailed(
+        self,
+        project: str,
+        team: str,
+        timeframe: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """List iterations for a team along with each iteration's work items.
+
+        The iterations API has no expand option for work items, so after the
+        list call the per-iteration lookups are issued concurrently and their
+        workItemRelations are attached to each iteration as "workItems".
+        """
+        iterations = await self.list_iterations(project, team, timeframe=timeframe)
+        values = iterations.get("value", [])
+        work_items = await asyncio.gather(
+            *(self.get_iteration_work_items(project, team, it["id"]) for it in values)
+        )
+        for iteration, items in zip(values, work_items):
+            iteration["workItems"] = items.get("workItemRelations", [])
+        return iterations
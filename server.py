@@ -23,14 +23,366 @@ if os.name == "nt":  # Windows
     fcntl_module.ioctl = lambda fd, req, arg=0, mut=True: 0
     sys.modules["fcntl"] = fcntl_module
 
-from typing import Annotated, Any, Optional
+import asyncio
+import re
+import signal
+import socket
+import subprocess
+import time
+from collections import deque
+from functools import partial, wraps
+from typing import Annotated, Any, Awaitable, Callable, Optional
+
+from uuid import UUID
+
+import anyio
+import httpx
+import orjson
+import uvicorn
+from anyio.abc import TaskStatus
+from loguru import logger
+from starlette.requests import Request
+from starlette.datastructures import URLPath
+from starlette.responses import Response
+from starlette.routing import BaseRoute, Match, NoMatchFound
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from arcade_mcp_server import MCPApp, Context
+from arcade_mcp_server import server as arcade_server
+from arcade_mcp_server import worker as arcade_worker
+from arcade_mcp_server.__main__ import run_stdio_server
+from arcade_mcp_server.convert import convert_to_mcp_content
+from arcade_mcp_server.exceptions import ServerError
+from arcade_mcp_server.fastapi.middleware import AddTrailingSlashToPathMiddleware
+from arcade_mcp_server.session import ServerSession
+from arcade_mcp_server.transports.http_session_manager import HTTPSessionManager
+from arcade_mcp_server.transports.http_streamable import (
+    MCP_SESSION_ID_HEADER,
+    HTTPStreamableTransport,
+)
+from arcade_mcp_server.types import MCPContent, TextContent
+from arcade_mcp_server.usage import ServerTracker
+from arcade_mcp_server.worker import (
+    CustomUvicornServer,
+    create_arcade_mcp,
+    serve_with_force_quit,
+)
 
 from arcade_azure_devops_mcp.client import AzureDevOpsClient, AzureDevOpsClientError
 from arcade_azure_devops_mcp.auth.manager import AuthManager
 
 
+class PermissiveHTTPStreamableTransport(HTTPStreamableTransport):
+    """Transport that accepts any Accept/Content-Type header and session ID."""
+
+    def _check_accept_headers(self, request: Request) -> tuple[bool, bool]:
+        return True, True
+
+    def _check_content_type(self, request: Request) -> bool:
+        return True
+
+    async def _validate_session(self, request: Request, send: Send) -> bool:
+        # A stale session ID is served by a fresh transport, so never reject it
+        return True
+
+
+class NoSlashMiddleware(AddTrailingSlashToPathMiddleware):
+    """Pass requests through untouched; adding slashes confuses routing for /sse and /messages."""
+
+    async def dispatch(self, request, call_next):
+        return await call_next(request)
+
+
+# Session IDs drawn from one os.urandom call per batch instead of one per session
+_SESSION_ID_BATCH = 256
+_SESSION_IDS: deque[str] = deque()
+
+
+def _new_session_id() -> str:
+    """Return a random UUID4 hex session ID, refilling the pool when it runs dry."""
+    if not _SESSION_IDS:
+        entropy = os.urandom(16 * _SESSION_ID_BATCH)
+        _SESSION_IDS.extend(
+            UUID(bytes=entropy[i : i + 16], version=4).hex
+            for i in range(0, len(entropy), 16)
+        )
+    return _SESSION_IDS.popleft()
+
+
+class PermissiveSessionManager(HTTPSessionManager):
+    """Session manager that treats unknown session IDs as new sessions instead of 400s."""
+
+    async def _handle_stateful_request(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process request in stateful mode - maintain session state."""
+        request = Request(scope, receive)
+        request_mcp_session_id = request.headers.get(MCP_SESSION_ID_HEADER)
+
+        # Existing session case
+        if request_mcp_session_id and request_mcp_session_id in self._server_instances:
+            transport = self._server_instances[request_mcp_session_id]
+            logger.debug("Session already exists, handling request directly")
+            await transport.handle_request(scope, receive, send)
+            return
+
+        # New session case (ID is None OR ID is unknown/stale). The permissive
+        # transport skips session validation, so the stale header is harmless.
+        if request_mcp_session_id:
+            logger.warning(
+                "Client sent unknown session ID {}. Creating new session.", request_mcp_session_id
+            )
+
+        logger.debug("Creating new transport")
+        new_session_id = _new_session_id()
+        http_transport = PermissiveHTTPStreamableTransport(
+            mcp_session_id=new_session_id,
+            is_json_response_enabled=self.json_response,
+            event_store=self.event_store,
+        )
+        if http_transport.mcp_session_id is None:
+            raise RuntimeError("MCP session ID not set")
+        # Registering is a plain dict write with no await, so it needs no lock;
+        # starting the session and serving the request run concurrently with
+        # other new sessions
+        self._server_instances[http_transport.mcp_session_id] = http_transport
+        logger.info("Created new transport with session ID: {}", new_session_id)
+
+        # Define the server runner
+        async def run_server(
+            *, task_status: TaskStatus[None] = anyio.TASK_STATUS_IGNORED
+        ) -> None:
+            async with http_transport.connect() as streams:
+                read_stream, write_stream = streams
+                task_status.started()
+                try:
+                    # Create a session for this connection
+                    session = ServerSession(
+                        server=self.server,
+                        session_id=http_transport.mcp_session_id,
+                        read_stream=read_stream,
+                        write_stream=write_stream,
+                        init_options={"transport_type": "http"},
+                    )
+
+                    # Set the session on the transport
+                    http_transport.session = session
+
+                    # Run the session (start + loop until closed)
+                    await session.run()
+                except Exception as e:
+                    logger.exception(
+                        "Session {} crashed: {}", http_transport.mcp_session_id, e
+                    )
+                finally:
+                    # Unregister before the transport streams unwind, on
+                    # clean exit as well as on crash
+                    if (
+                        http_transport.mcp_session_id
+                        and http_transport.mcp_session_id in self._server_instances
+                        and not http_transport.is_terminated
+                    ):
+                        logger.info("Cleaning up session {}", http_transport.mcp_session_id)
+                        del self._server_instances[http_transport.mcp_session_id]
+                    await _close_session_clients(http_transport.mcp_session_id)
+
+        if self._task_group is None:
+            raise RuntimeError("Task group not initialized")
+        await self._task_group.start(run_server)
+
+        # Handle the HTTP request
+        await http_transport.handle_request(scope, receive, send)
+
+    async def _handle_stateless_request(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process request in stateless mode - new transport and session per request.
+
+        Every tool here answers a single request with a single JSON response,
+        so the throwaway session is marked initialized up front and requests
+        can call tools without an initialize handshake.
+        """
+        http_transport = PermissiveHTTPStreamableTransport(
+            mcp_session_id=None,
+            is_json_response_enabled=self.json_response,
+            event_store=None,
+        )
+
+        async def run_stateless_server(
+            *, task_status: TaskStatus[None] = anyio.TASK_STATUS_IGNORED
+        ) -> None:
+            async with http_transport.connect() as streams:
+                read_stream, write_stream = streams
+                task_status.started()
+                session = ServerSession(
+                    server=self.server,
+                    read_stream=read_stream,
+                    write_stream=write_stream,
+                    init_options={"transport_type": "http"},
+                    stateless=True,
+                )
+                session.mark_initialized()
+                http_transport.session = session
+                try:
+                    await session.run()
+                except Exception:
+                    logger.exception("Stateless session crashed")
+                finally:
+                    await _close_session_clients(session.session_id)
+
+        if self._task_group is None:
+            raise RuntimeError("Task group not initialized")
+        await self._task_group.start(run_stateless_server)
+
+        await http_transport.handle_request(scope, receive, send)
+        await http_transport.terminate()
+
+
+def _install_permissive_http(stateless: bool = False) -> None:
+    """Point the Arcade worker at the permissive HTTP classes.
+
+    ``create_arcade_mcp`` builds its session manager and middleware from the
+    worker module's globals and takes no class arguments, so rebind those
+    names instead of patching methods on the framework classes.
+
+    Args:
+        stateless: Serve every request on a throwaway session instead of
+            keeping per-client session state.
+    """
+    arcade_worker.HTTPSessionManager = (
+        partial(PermissiveSessionManager, stateless=True)
+        if stateless
+        else PermissiveSessionManager
+    )
+    arcade_worker.AddTrailingSlashToPathMiddleware = NoSlashMiddleware
+
+
+def _orjson_mcp_content(value: Any) -> list[MCPContent]:
+    """Convert a tool result to MCP content, encoding dicts and lists with orjson."""
+    if isinstance(value, (dict, list)):
+        try:
+            text = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+            return [TextContent(type="text", text=text)]
+        except orjson.JSONEncodeError:
+            # Out-of-range ints and other types orjson rejects; let the stdlib encoder handle them
+            pass
+    return convert_to_mcp_content(value)
+
+
+def _install_fast_json() -> None:
+    """Encode tool results with orjson instead of the stdlib json encoder.
+
+    The MCP server converts every tool result through ``convert_to_mcp_content``
+    imported into its own module, so rebind that name there.
+    """
+    arcade_server.convert_to_mcp_content = _orjson_mcp_content
+
+
+class MCPProxyRoute(BaseRoute):
+    """Route every request under /sse or /messages to an ASGI app.
+
+    Matches both prefixes with one precompiled pattern, in place of a Mount
+    per prefix at the end of the route table.
+    """
+
+    PATH_PATTERN = re.compile(r"/(?:sse|messages)(?:/|$)")
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    def matches(self, scope: Scope) -> tuple[Match, Scope]:
+        if scope["type"] == "http" and self.PATH_PATTERN.match(scope["path"]):
+            return Match.FULL, {}
+        return Match.NONE, {}
+
+    def url_path_for(self, name: str, /, **path_params: Any) -> URLPath:
+        raise NoMatchFound(name, path_params)
+
+    async def handle(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.app(scope, receive, send)
+
+
+# Health check response body, serialized once
+_HEALTH_BODY = orjson.dumps({"status": "ok", "service": "azure-devops-mcp"})
+
+
+async def _serve_reuse_port(app_instance: Any, host: str, port: int, log_level: str) -> None:
+    """Serve like ``serve_with_force_quit``, on a socket bound with SO_REUSEPORT."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    sock.set_inheritable(True)
+
+    config = uvicorn.Config(
+        app=app_instance,
+        log_level=log_level,
+        lifespan="on",
+        timeout_graceful_shutdown=int(
+            os.environ.get("ARCADE_UVICORN_TIMEOUT_GRACEFUL_SHUTDOWN", "15")
+        ),
+    )
+    server = CustomUvicornServer(config, app_instance.state.task_tracker)
+    await server.serve(sockets=[sock])
+
+
+def _http_workers() -> int:
+    """Get the HTTP worker count from MCP_HTTP_WORKERS, falling back to 1."""
+    setting = os.getenv("MCP_HTTP_WORKERS", "1")
+    try:
+        workers = int(setting)
+    except ValueError:
+        workers = 0
+    if workers < 1:
+        logger.warning("Ignoring invalid MCP_HTTP_WORKERS={!r}; using 1 worker", setting)
+        return 1
+    return workers
+
+
+def _supervise_workers(count: int) -> None:
+    """Run count HTTP worker processes until SIGINT or SIGTERM, restarting any that crash.
+
+    Workers are fresh interpreters rather than forks, so no threads or locks
+    created at import are copied into them. Each binds the port with
+    SO_REUSEPORT. Signals are forwarded to the workers, and this returns
+    once they have all exited.
+    """
+    argv = [sys.executable, *sys.argv]
+    env = {**os.environ, "MCP_HTTP_WORKER": "1"}
+    workers: dict[int, subprocess.Popen] = {}
+    stopping = False
+
+    def spawn() -> None:
+        # Own session, so a terminal Ctrl-C reaches the workers only once, via us
+        proc = subprocess.Popen(argv, env=env, start_new_session=True)
+        workers[proc.pid] = proc
+
+    def forward(signum: int, _frame: Any) -> None:
+        nonlocal stopping
+        stopping = True
+        for proc in workers.values():
+            if proc.returncode is None:
+                proc.send_signal(signum)
+
+    signal.signal(signal.SIGINT, forward)
+    signal.signal(signal.SIGTERM, forward)
+    for _ in range(count):
+        spawn()
+
+    while workers:
+        pid, status = os.wait()
+        proc = workers.pop(pid, None)
+        if proc is None:
+            continue
+        proc.returncode = os.waitstatus_to_exitcode(status)
+        if not stopping:
+            logger.warning(
+                "HTTP worker {} exited with code {}; restarting it",
+                pid,
+                proc.returncode,
+            )
+            # Back off briefly so a worker that fails at startup cannot spin
+            time.sleep(1.0)
+            if not stopping:
+                spawn()
+
+
 class AsyncMCPApp(MCPApp):
     """MCPApp subclass with run_async support for FastMCP compatibility."""
 
@@ -40,12 +392,23 @@ class AsyncMCPApp(MCPApp):
         port: int = 8000,
         reload: bool = False,
         transport: str = "stdio",
+        stateless: bool = False,
+        reuse_port: bool = False,
         **kwargs: Any,
     ) -> None:
-        """Run the server asynchronously."""
+        """Run the server asynchronously.
+
+        Args:
+            host: Host to bind the HTTP transport to.
+            port: Port to bind the HTTP transport to.
+            reload: Restart the server when source files change.
+            transport: "stdio" or one of the HTTP transports.
+            stateless: Skip MCP session tracking on the HTTP transport and
+                serve each request on a throwaway session.
+            reuse_port: Bind the HTTP port with SO_REUSEPORT so several server
+                processes can share it, with the kernel balancing connections.
+        """
         if len(self._catalog) == 0:
-            import sys
-            from loguru import logger
             logger.error("No tools added to the server. Use @app.tool decorator or app.add_tool().")
             sys.exit(1)
 
@@ -56,252 +419,216 @@ class AsyncMCPApp(MCPApp):
 
         self._setup_logging(transport == "stdio")
 
-        import os
-        from loguru import logger
-        from arcade_mcp_server.exceptions import ServerError
-        
         if os.getenv("ARCADE_MCP_CHILD_PROCESS") == "1":
             reload = False
 
         logger.info(f"Starting {self._name} v{self.version} with {len(self._catalog)} tools")
 
-        # Monkey-patch HTTPStreamableTransport to be permissive
-        from arcade_mcp_server.transports.http_streamable import HTTPStreamableTransport
-        from starlette.requests import Request
-        from starlette.types import Send
-        
-        # Patch headers check
-        def permissive_check_headers(self, request):
-            return True, True
-        HTTPStreamableTransport._check_accept_headers = permissive_check_headers
-
-        # Patch content type check
-        def permissive_check_content_type(self, request):
-            return True
-        HTTPStreamableTransport._check_content_type = permissive_check_content_type
-
-        # Patch session validation to allow ALL requests to proceed without session ID
-        async def permissive_validate_session(self, request: Request, send: Send) -> bool:
-            return True
-        HTTPStreamableTransport._validate_session = permissive_validate_session
-        
-        # Patch middleware to disable slash adding which confuses routing for new endpoints
-        from arcade_mcp_server.fastapi.middleware import AddTrailingSlashToPathMiddleware
-        async def noop_dispatch(self, request, call_next):
-             return await call_next(request)
-        AddTrailingSlashToPathMiddleware.dispatch = noop_dispatch
-
-        # Patch HTTPSessionManager to handle stale session IDs gracefully
-        from arcade_mcp_server.transports.http_session_manager import HTTPSessionManager
-        from arcade_mcp_server.transports.http_streamable import MCP_SESSION_ID_HEADER
-        from uuid import uuid4
-        from anyio.abc import TaskStatus
-        import anyio
-        from arcade_mcp_server.session import ServerSession
-        from starlette.types import Scope, Receive, Send
-
-        async def permissive_handle_stateful_request(self, scope: Scope, receive: Receive, send: Send) -> None:
-            """Process request in stateful mode - maintain session state.
-            Patched to treat unknown session IDs as new sessions instead of 400s.
-            """
-            request = Request(scope, receive)
-            request_mcp_session_id = request.headers.get(MCP_SESSION_ID_HEADER)
-
-            # Existing session case
-            if request_mcp_session_id and request_mcp_session_id in self._server_instances:
-                transport = self._server_instances[request_mcp_session_id]
-                logger.debug("Session already exists, handling request directly")
-                await transport.handle_request(scope, receive, send)
-                return
-
-            # New session case (ID is None OR ID is unknown/stale)
-            # Original code would return 400 for unknown ID. We proceed to create new.
-            
-            if request_mcp_session_id and request_mcp_session_id not in self._server_instances:
-                logger.warning(f"Client sent unknown session ID {request_mcp_session_id}. Creating new session.")
-                # We don't need to unset the header because we just proceed to create a new transport
-                # and ignore the incoming ID for the purpose of lookup.
-                # However, the Transport itself might check the header against its own ID?
-                # HTTPStreamableTransport._validate_session checks if header matches self.mcp_session_id.
-                # If we create a NEW transport with a NEW ID, but the request still has the OLD ID header,
-                # _validate_session will fail (return 404 or 400).
+        # Serve HTTP through the permissive transport, session manager and middleware
+        _install_permissive_http(stateless)
+        _install_fast_json()
+
+        warm_up: Optional[asyncio.Task] = None
+        try:
+            if transport in ["http", "streamable-http", "streamable"]:
+                if reload:
+                    # Reloading is typically synchronous/blocking for the watcher
+                    self._run_with_reload(host, port)
+                else:
+                    # Open the shared connection pool with the server rather
+                    # than on the first tool call; it lives until run_async
+                    # returns. TLS and HTTP/2 setup to the ADO hosts happens in
+                    # the background meanwhile. stdio sessions skip this, as
+                    # they may never call a tool.
+                    warm_up = asyncio.create_task(AzureDevOpsClient.preconnect(_get_http()))
+
+                    debug = self.log_level == "DEBUG"
+                    log_level = "debug" if debug else "info"
+
+                    app_instance = create_arcade_mcp(
+                        catalog=self._catalog,
+                        mcp_settings=self._mcp_settings,
+                        debug=debug,
+                        **self.server_kwargs,
+                    )
+
+                    # Define a proxy class
+                    class MCPASGIProxy:
+                        def __init__(self, parent_app):
+                            self._app = parent_app
+
+                        async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+                            session_manager = getattr(self._app.state, "session_manager", None)
+                            if session_manager is None:
+                                resp = Response("MCP server not initialized", status_code=503)
+                                await resp(scope, receive, send)
+                                return
+                            await session_manager.handle_request(scope, receive, send)
+
+                    # Route /sse and /messages to the proxy ahead of the other routes
+                    proxy = MCPASGIProxy(app_instance)
+                    app_instance.router.routes.insert(0, MCPProxyRoute(proxy))
                 
-                # So we MUST remove the header from the request/scope before passing it to the new transport.
-                # Modifying 'scope' headers is tricky but possible.
+                    # Add root route for health checks
+                    @app_instance.get("/")
+                    async def root():
+                        return Response(content=_HEALTH_BODY, media_type="application/json")
+
+                    # print(f"App instance type: {type(app_instance)}")
+                    # for route in app_instance.routes:
+                    #     print(f"Registered route: {route.path}")
+
+                    tracker = ServerTracker()
+                    tracker.track_server_start(
+                        transport="http",
+                        host=host,
+                        port=port,
+                        tool_count=len(self._catalog),
+                    )
+
+                    if reuse_port:
+                        await _serve_reuse_port(app_instance, host, port, log_level)
+                    else:
+                        await serve_with_force_quit(
+                            app=app_instance,
+                            host=host,
+                            port=port,
+                            log_level=log_level,
+                        )
                 
-                # Actually, simpler: We patched _validate_session in HTTPStreamableTransport to always return True!
-                # So the mismatch won't matter there.
-                pass
-
-            logger.debug("Creating new transport")
-            async with self._session_creation_lock:
-                new_session_id = uuid4().hex
-                http_transport = HTTPStreamableTransport(
-                    mcp_session_id=new_session_id,
-                    is_json_response_enabled=self.json_response,
-                    event_store=self.event_store,
+            elif transport == "stdio":
+                tracker = ServerTracker()
+                tracker.track_server_start(
+                    transport="stdio",
+                    host=None,
+                    port=None,
+                    tool_count=len(self._catalog),
                 )
-
-                if http_transport.mcp_session_id is None:
-                    raise RuntimeError("MCP session ID not set")
-                self._server_instances[http_transport.mcp_session_id] = http_transport
-                logger.info(f"Created new transport with session ID: {new_session_id}")
-
-                # Define the server runner
-                async def run_server(
-                    *, task_status: TaskStatus[None] = anyio.TASK_STATUS_IGNORED
-                ) -> None:
-                    async with http_transport.connect() as streams:
-                        read_stream, write_stream = streams
-                        task_status.started()
-                        try:
-                            # Create a session for this connection
-                            session = ServerSession(
-                                server=self.server,
-                                read_stream=read_stream,
-                                write_stream=write_stream,
-                                init_options={"transport_type": "http"},
-                            )
-
-                            # Set the session on the transport
-                            http_transport.session = session
-
-                            # Run the session (start + loop until closed)
-                            await session.run()
-
-                            # Brief yield to allow cleanup
-                            await anyio.sleep(0)
-                        except Exception as e:
-                            logger.error(
-                                f"Session {http_transport.mcp_session_id} crashed: {e}",
-                                exc_info=True,
-                            )
-                        finally:
-                            # Clean up on crash
-                            if (
-                                http_transport.mcp_session_id
-                                and http_transport.mcp_session_id in self._server_instances
-                                and not http_transport.is_terminated
-                            ):
-                                logger.info(
-                                    f"Cleaning up crashed session {http_transport.mcp_session_id}"
-                                )
-                                del self._server_instances[http_transport.mcp_session_id]
-
-                if self._task_group is None:
-                    raise RuntimeError("Task group not initialized")
-                await self._task_group.start(run_server)
-
-                # Handle the HTTP request
-                await http_transport.handle_request(scope, receive, send)
-
-        HTTPSessionManager._handle_stateful_request = permissive_handle_stateful_request
-
-        if transport in ["http", "streamable-http", "streamable"]:
-            if reload:
-                # Reloading is typically synchronous/blocking for the watcher
-                self._run_with_reload(host, port)
-            else:
-                debug = self.log_level == "DEBUG"
-                log_level = "debug" if debug else "info"
-                
-                from arcade_mcp_server.worker import create_arcade_mcp, serve_with_force_quit
-                from arcade_mcp_server.usage import ServerTracker
-                from starlette.responses import Response
-                from starlette.types import Scope, Receive, Send
-
-                app_instance = create_arcade_mcp(
+                await run_stdio_server(
                     catalog=self._catalog,
-                    mcp_settings=self._mcp_settings,
-                    debug=debug,
+                    settings=self._mcp_settings,
                     **self.server_kwargs,
                 )
+            else:
+                raise ServerError(f"Invalid transport: {transport}")
+        finally:
+            if warm_up is not None:
+                warm_up.cancel()
+            # Sessions' clients share one connection pool; close it on the way out
+            await _close_http()
 
-                # Define a proxy class
-                class MCPASGIProxy:
-                    def __init__(self, parent_app):
-                        self._app = parent_app
-
-                    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
-                        session_manager = getattr(self._app.state, "session_manager", None)
-                        if session_manager is None:
-                            resp = Response("MCP server not initialized", status_code=503)
-                            await resp(scope, receive, send)
-                            return
-                        await session_manager.handle_request(scope, receive, send)
-
-                # Mount the proxy at /sse and /messages
-                proxy = MCPASGIProxy(app_instance)
-                
-                # Use mount which matches path prefixes and is robust
-                app_instance.mount("/sse", proxy)
-                app_instance.mount("/messages", proxy)
-                
-                # Add root route for health checks
-                @app_instance.get("/")
-                async def root():
-                    return {"status": "ok", "service": "azure-devops-mcp"}
 
-                # print(f"App instance type: {type(app_instance)}")
-                # for route in app_instance.routes:
-                #     print(f"Registered route: {route.path}")
+# Create the MCP App. Tools register at import time, where the catalog builds
+# each tool's input/output models once; calls validate against those models
+# without re-inspecting the signatures.
+app = AsyncMCPApp(name="azure_devops", version="0.1.0", log_level="INFO")
 
-                tracker = ServerTracker()
-                tracker.track_server_start(
-                    transport="http",
-                    host=host,
-                    port=port,
-                    tool_count=len(self._catalog),
-                )
+# Secrets required for Azure DevOps authentication. This must stay a list: the
+# catalog only converts list-typed requirements, once per tool at registration.
+AZURE_SECRETS = ["AZURE_DEVOPS_ORG", "AZURE_DEVOPS_PAT"]
 
-                await serve_with_force_quit(
-                    app=app_instance,
-                    host=host,
-                    port=port,
-                    log_level=log_level,
-                )
-                
-        elif transport == "stdio":
-            from arcade_mcp_server.__main__ import run_stdio_server
-            from arcade_mcp_server.usage import ServerTracker
-
-            tracker = ServerTracker()
-            tracker.track_server_start(
-                transport="stdio",
-                host=None,
-                port=None,
-                tool_count=len(self._catalog),
-            )
-            await run_stdio_server(
-                catalog=self._catalog,
-                settings=self._mcp_settings,
-                **self.server_kwargs,
-            )
-        else:
-            raise ServerError(f"Invalid transport: {transport}")
 
+# One HTTP connection pool for the whole process, shared by every session's client
+_HTTP: Optional[httpx.AsyncClient] = None
 
-# Create the MCP App
-app = AsyncMCPApp(name="azure_devops", version="0.1.0", log_level="INFO")
 
-# Secrets required for Azure DevOps authentication
-AZURE_SECRETS = ["AZURE_DEVOPS_ORG", "AZURE_DEVOPS_PAT"]
+def _get_http() -> httpx.AsyncClient:
+    """Get the process-wide HTTP client, creating it on first use."""
+    global _HTTP
+    if _HTTP is None or _HTTP.is_closed:
+        _HTTP = AzureDevOpsClient.create_http_client()
+    return _HTTP
+
+
+async def _close_http() -> None:
+    """Close the process-wide HTTP client at shutdown.
+
+    Cached session clients are closed and dropped first, since they all use
+    this pool; closing them also stops their background token refreshes.
+    """
+    global _HTTP
+    while _CLIENTS:
+        _, client = _CLIENTS.popitem()
+        await client.close()
+    if _HTTP is not None:
+        await _HTTP.aclose()
+        _HTTP = None
+
 
+# One client per MCP session and user, reused across tool calls
+_CLIENTS: dict[tuple[Optional[str], Optional[str]], AzureDevOpsClient] = {}
+_CLIENTS_LOCK = asyncio.Lock()
 
-def _get_client(context: Optional[Context] = None) -> AzureDevOpsClient:
-    """Get an authenticated Azure DevOps client.
+
+def _client_key(context: Optional[Context]) -> tuple[Optional[str], Optional[str]]:
+    """Key a cached client by session and user, so credentials are never shared."""
+    return getattr(context, "session_id", None), getattr(context, "user_id", None)
+
+
+async def _get_client(context: Optional[Context] = None) -> AzureDevOpsClient:
+    """Get an authenticated Azure DevOps client for the caller's session.
     
     Args:
         context: Optional Arcade context for secrets fallback
     """
-    auth = AuthManager(context=context)
-    return AzureDevOpsClient(auth)
+    key = _client_key(context)
+    client = _CLIENTS.get(key)
+    if client is None:
+        async with _CLIENTS_LOCK:
+            client = _CLIENTS.get(key)
+            if client is None:
+                auth = AuthManager(context=context)
+                client = _CLIENTS[key] = AzureDevOpsClient(auth, http=_get_http())
+    return client
+
+
+async def _close_session_clients(session_id: Optional[str]) -> None:
+    """Close and forget the clients cached for a session that has ended."""
+    for key in [key for key in _CLIENTS if key[0] == session_id]:
+        await _CLIENTS.pop(key).close()
+
+
+class AzureDevOpsToolError(RuntimeError):
+    """RuntimeError raised by a tool for a failed Azure DevOps call.
+
+    The message is formatted up front, so the error does not keep the tool's
+    arguments (including the Arcade context and its secrets) alive.
+    """
+
+    def __init__(self, message: str, arguments: dict[str, Any], inner: AzureDevOpsClientError):
+        super().__init__(f"{message.format(**arguments)}: {inner}")
+        self.inner = inner
+
+
+def _azure_tool(message: str) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """Translate Azure DevOps client errors raised by a tool into RuntimeErrors.
+
+    The wrapper keeps the tool's signature (via ``__wrapped__``), so the
+    catalog still builds the tool's input model from the original function.
+
+    Args:
+        message: Error prefix, formatted with the tool's keyword arguments.
+    """
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        @wraps(func)
+        async def wrapper(**kwargs: Any) -> Any:
+            try:
+                return await func(**kwargs)
+            except AzureDevOpsClientError as e:
+                raise AzureDevOpsToolError(message, kwargs, e) from e
+        return wrapper
+    return decorator
 
 
 # ==================== Core Tools ====================
 
+# The project, team, repository and wiki list tools are answered from the
+# session client's TTL response cache (AzureDevOpsClient.CACHE_TTL_LIST), which
+# write calls invalidate per project.
+
 
 @app.tool(requires_secrets=AZURE_SECRETS)
+@_azure_tool("Failed to list projects")
 async def list_projects(
     context: Context,
     state_filter: Annotated[str, "Filter projects by state: wellFormed, createPending, deleted, all"] = "wellFormed",
@@ -309,31 +636,23 @@ async def list_projects(
     skip: Annotated[Optional[int], "Number of projects to skip for pagination"] = None,
 ) -> Annotated[dict[str, Any], "List of projects in the organization"]:
     """List all projects in the Azure DevOps organization."""
-    client = _get_client(context)
-    try:
-        return await client.list_projects(state_filter=state_filter, top=top, skip=skip)
-    except AzureDevOpsClientError as e:
-        raise RuntimeError(f"Failed to list projects: {e}") from e
-    finally:
-        await client.close()
+    client = await _get_client(context)
+    return await client.list_projects(state_filter=state_filter, top=top, skip=skip)
 
 
 @app.tool(requires_secrets=AZURE_SECRETS)
+@_azure_tool("Failed to get project '{project}'")
 async def get_project(
     context: Context,
     project: Annotated[str, "Project name or ID"],
 ) -> Annotated[dict[str, Any], "Project details"]:
     """Get details of a specific Azure DevOps project."""
-    client = _get_client(context)
-    try:
-        return await client.get_project(project)
-    except AzureDevOpsClientError as e:
-        raise RuntimeError(f"Failed to get project '{project}': {e}") from e
-    finally:
-        await client.close()
+    client = await _get_client(context)
+    return await client.get_project(project)
 
 
 @app.tool(requires_secrets=AZURE_SECRETS)
+@_azure_tool("Failed to list teams")
 async def list_teams(
     context: Context,
     project: Annotated[str, "Project name or ID"],
@@ -341,52 +660,73 @@ async def list_teams(
     skip: Annotated[Optional[int], "Number of teams to skip for pagination"] = None,
 ) -> Annotated[dict[str, Any], "List of teams in the project"]:
     """List all teams in a project."""
-    client = _get_client(context)
-    try:
-        return await client.list_teams(project=project, top=top, skip=skip)
-    except AzureDevOpsClientError as e:
-        raise RuntimeError(f"Failed to list teams: {e}") from e
-    finally:
-        await client.close()
+    client = await _get_client(context)
+    return await client.list_teams(project=project, top=top, skip=skip)
 
 
 @app.tool(requires_secrets=AZURE_SECRETS)
+@_azure_tool("Failed to search identities")
 async def search_identities(
     context: Context,
     search_filter: Annotated[str, "Filter type: General, AccountName, DisplayName, MailAddress"],
     filter_value: Annotated[str, "Value to search for"],
 ) -> Annotated[dict[str, Any], "List of matching identities"]:
     """Search for identities (users/groups) in Azure DevOps."""
-    client = _get_client(context)
-    try:
-        return await client.get_identities(search_filter=search_filter, filter_value=filter_value)
-    except AzureDevOpsClientError as e:
-        raise RuntimeError(f"Failed to search identities: {e}") from e
-    finally:
-        await client.close()
+    client = await _get_client(context)
+    return await client.get_identities(search_filter=search_filter, filter_value=filter_value)
 
 
 # ==================== Work Item Tools ====================
 
 
 @app.tool(requires_secrets=AZURE_SECRETS)
+@_azure_tool("Failed to get work item {work_item_id}")
 async def get_work_item(
     context: Context,
     project: Annotated[str, "Project name or ID"],
     work_item_id: Annotated[int, "Work item ID"],
     expand: Annotated[Optional[str], "Expand options: None, Relations, Fields, Links, All"] = None,
+    fields: Annotated[
+        Optional[list[str]],
+        "Only return these fields (e.g. System.Title, System.State); cannot be combined with expand",
+    ] = None,
 ) -> Annotated[dict[str, Any], "Work item details"]:
     """Get a work item by ID."""
-    client = _get_client(context)
-    try:
-        return await client.get_work_item(project=project, work_item_id=work_item_id, expand=expand)
-    except AzureDevOpsClientError as e:
-        raise RuntimeError(f"Failed to get work item {work_item_id}: {e}") from e
-    finally:
-        await client.close()
+    client = await _get_client(context)
+    return await client.get_work_item(
+        project=project, work_item_id=work_item_id, expand=expand, fields=fields
+    )
+
+
+# JSON-patch paths for the optional work item tool arguments, in argument order
+_CREATE_FIELD_PATHS = (
+    "/fields/System.Description",
+    "/fields/System.AssignedTo",
+    "/fields/System.AreaPath",
+    "/fields/System.IterationPath",
+    "/fields/System.State",
+    "/fields/Microsoft.VSTS.Common.Priority",
+)
+_UPDATE_FIELD_PATHS = (
+    "/fields/System.Title",
+    "/fields/System.Description",
+    "/fields/System.AssignedTo",
+    "/fields/System.State",
+    "/fields/Microsoft.VSTS.Common.Priority",
+)
+
+
+def _field_patch(paths: tuple[str, ...], values: tuple[Any, ...]) -> list[dict[str, Any]]:
+    """Build "add" operations for the provided (non-empty) field values."""
+    return [
+        {"op": "add", "path": path, "value": value}
+        for path, value in zip(paths, values)
+        if value
+    ]
 
 
 @app.tool(requires_secrets=AZURE_SECRETS)
+@_azure_tool("Failed to create work item")
 async def create_work_item(
     context: Context,
     project: Annotated[str, "Project name or ID"],
@@ -400,32 +740,17 @@ async def create_work_item(
     priority: Annotated[Optional[int], "Priority (1-4, where 1 is highest)"] = None,
 ) -> Annotated[dict[str, Any], "Created work item"]:
     """Create a new work item."""
-    client = _get_client(context)
-    try:
-        document: list[dict[str, Any]] = [
-            {"op": "add", "path": "/fields/System.Title", "value": title}
-        ]
-        if description:
-            document.append({"op": "add", "path": "/fields/System.Description", "value": description})
-        if assigned_to:
-            document.append({"op": "add", "path": "/fields/System.AssignedTo", "value": assigned_to})
-        if area_path:
-            document.append({"op": "add", "path": "/fields/System.AreaPath", "value": area_path})
-        if iteration_path:
-            document.append({"op": "add", "path": "/fields/System.IterationPath", "value": iteration_path})
-        if state:
-            document.append({"op": "add", "path": "/fields/System.State", "value": state})
-        if priority:
-            document.append({"op": "add", "path": "/fields/Microsoft.VSTS.Common.Priority", "value": priority})
-
-        return await client.create_work_item(project=project, work_item_type=work_item_type, document=document)
-    except AzureDevOpsClientError as e:
-        raise RuntimeError(f"Failed to create work item: {e}") from e
-    finally:
-        await client.close()
+    client = await _get_client(context)
+    document = [{"op": "add", "path": "/fields/System.Title", "value": title}]
+    document += _field_patch(
+        _CREATE_FIELD_PATHS,
+        (description, assigned_to, area_path, iteration_path, state, priority),
+    )
+    return await client.create_work_item(project=project, work_item_type=work_item_type, document=document)
 
 
 @app.tool(requires_secrets=AZURE_SECRETS)
+@_azure_tool("Failed to update work item {work_item_id}")
 async def update_work_item(
     context: Context,
     project: Annotated[str, "Project name or ID"],
@@ -437,31 +762,17 @@ async def update_work_item(
     priority: Annotated[Optional[int], "New priority"] = None,
 ) -> Annotated[dict[str, Any], "Updated work item"]:
     """Update an existing work item."""
-    client = _get_client(context)
-    try:
-        document: list[dict[str, Any]] = []
-        if title:
-            document.append({"op": "add", "path": "/fields/System.Title", "value": title})
-        if description:
-            document.append({"op": "add", "path": "/fields/System.Description", "value": description})
-        if assigned_to:
-            document.append({"op": "add", "path": "/fields/System.AssignedTo", "value": assigned_to})
-        if state:
-            document.append({"op": "add", "path": "/fields/System.State", "value": state})
-        if priority:
-            document.append({"op": "add", "path": "/fields/Microsoft.VSTS.Common.Priority", "value": priority})
-
-        if not document:
-            raise RuntimeError("No fields provided to update")
-
-        return await client.update_work_item(project=project, work_item_id=work_item_id, document=document)
-    except AzureDevOpsClientError as e:
-        raise RuntimeError(f"Failed to update work item {work_item_id}: {e}") from e
-    finally:
-        await client.close()
+    values = (title, description, assigned_to, state, priority)
+    if not any(values):
+        raise RuntimeError("No fields provided to update")
+
+    client = await _get_client(context)
+    document = _field_patch(_UPDATE_FIELD_PATHS, values)
+    return await client.update_work_item(project=project, work_item_id=work_item_id, document=document)
 
 
 @app.tool(requires_secrets=AZURE_SECRETS)
+@_azure_tool("Failed to run query")
 async def run_work_item_query(
     context: Context,
     project: Annotated[str, "Project name or ID"],
@@ -469,16 +780,28 @@ async def run_work_item_query(
     top: Annotated[Optional[int], "Maximum number of results"] = None,
 ) -> Annotated[dict[str, Any], "Query results"]:
     """Run a WIQL (Work Item Query Language) query."""
-    client = _get_client(context)
-    try:
-        return await client.run_wiql_query(project=project, query=query, top=top)
-    except AzureDevOpsClientError as e:
-        raise RuntimeError(f"Failed to run query: {e}") from e
-    finally:
-        await client.close()
+    client = await _get_client(context)
+    return await client.run_wiql_query(project=project, query=query, top=top)
+
+
+# WIQL for my_work_items; the only variation is whether completed states are filtered out
+_MY_WORK_ITEMS_QUERY_ALL = (
+    "SELECT [System.Id], [System.Title], [System.State], [System.WorkItemType] "
+    "FROM WorkItems "
+    "WHERE [System.AssignedTo] = @Me "
+    "ORDER BY [System.ChangedDate] DESC"
+)
+_MY_WORK_ITEMS_QUERY_OPEN = (
+    "SELECT [System.Id], [System.Title], [System.State], [System.WorkItemType] "
+    "FROM WorkItems "
+    "WHERE [System.AssignedTo] = @Me "
+    "AND [System.State] <> 'Closed' AND [System.State] <> 'Done' AND [System.State] <> 'Removed' "
+    "ORDER BY [System.ChangedDate] DESC"
+)
 
 
 @app.tool(requires_secrets=AZURE_SECRETS)
+@_azure_tool("Failed to get my work items")
 async def my_work_items(
     context: Context,
     project: Annotated[str, "Project name or ID"],
@@ -486,26 +809,13 @@ async def my_work_items(
     top: Annotated[int, "Maximum number of work items to return"] = 50,
 ) -> Annotated[dict[str, Any], "Work items assigned to current user"]:
     """Get work items assigned to the current user."""
-    client = _get_client(context)
-    try:
-        state_filter = ""
-        if not include_completed:
-            state_filter = "AND [System.State] <> 'Closed' AND [System.State] <> 'Done' AND [System.State] <> 'Removed'"
-
-        query = f"""
-        SELECT [System.Id], [System.Title], [System.State], [System.WorkItemType]
-        FROM WorkItems
-        WHERE [System.AssignedTo] = @Me {state_filter}
-        ORDER BY [System.ChangedDate] DESC
-        """
-        return await client.run_wiql_query(project=project, query=query, top=top)
-    except AzureDevOpsClientError as e:
-        raise RuntimeError(f"Failed to get my work items: {e}") from e
-    finally:
-        await client.close()
+    client = await _get_client(context)
+    query = _MY_WORK_ITEMS_QUERY_ALL if include_completed else _MY_WORK_ITEMS_QUERY_OPEN
+    return await client.run_wiql_query(project=project, query=query, top=top)
 
 
 @app.tool(requires_secrets=AZURE_SECRETS)
+@_azure_tool("Failed to add comment")
 async def add_work_item_comment(
     context: Context,
     project: Annotated[str, "Project name or ID"],
@@ -513,34 +823,26 @@ async def add_work_item_comment(
     text: Annotated[str, "Comment text (supports HTML)"],
 ) -> Annotated[dict[str, Any], "Created comment"]:
     """Add a comment to a work item."""
-    client = _get_client(context)
-    try:
-        return await client.add_work_item_comment(project=project, work_item_id=work_item_id, text=text)
-    except AzureDevOpsClientError as e:
-        raise RuntimeError(f"Failed to add comment: {e}") from e
-    finally:
-        await client.close()
+    client = await _get_client(context)
+    return await client.add_work_item_comment(project=project, work_item_id=work_item_id, text=text)
 
 
 # ==================== Repository Tools ====================
 
 
 @app.tool(requires_secrets=AZURE_SECRETS)
+@_azure_tool("Failed to list repositories")
 async def list_repositories(
     context: Context,
     project: Annotated[str, "Project name or ID"],
 ) -> Annotated[dict[str, Any], "List of repositories"]:
     """List all Git repositories in a project."""
-    client = _get_client(context)
-    try:
-        return await client.list_repositories(project=project)
-    except AzureDevOpsClientError as e:
-        raise RuntimeError(f"Failed to list repositories: {e}") from e
-    finally:
-        await client.close()
+    client = await _get_client(context)
+    return await client.list_repositories(project=project)
 
 
 @app.tool(requires_secrets=AZURE_SECRETS)
+@_azure_tool("Failed to list branches")
 async def list_branches(
     context: Context,
     project: Annotated[str, "Project name or ID"],
@@ -549,16 +851,12 @@ async def list_branches(
     top: Annotated[Optional[int], "Maximum number of branches to return"] = None,
 ) -> Annotated[dict[str, Any], "List of branches"]:
     """List branches in a repository."""
-    client = _get_client(context)
-    try:
-        return await client.list_branches(project=project, repository_id=repository_id, filter_contains=filter_contains, top=top)
-    except AzureDevOpsClientError as e:
-        raise RuntimeError(f"Failed to list branches: {e}") from e
-    finally:
-        await client.close()
+    client = await _get_client(context)
+    return await client.list_branches(project=project, repository_id=repository_id, filter_contains=filter_contains, top=top)
 
 
 @app.tool(requires_secrets=AZURE_SECRETS)
+@_azure_tool("Failed to list pull requests")
 async def list_pull_requests(
     context: Context,
     project: Annotated[str, "Project name or ID"],
@@ -567,16 +865,12 @@ async def list_pull_requests(
     top: Annotated[int, "Maximum number of PRs to return"] = 50,
 ) -> Annotated[dict[str, Any], "List of pull requests"]:
     """List pull requests in a repository."""
-    client = _get_client(context)
-    try:
-        return await client.list_pull_requests(project=project, repository_id=repository_id, status=status, top=top)
-    except AzureDevOpsClientError as e:
-        raise RuntimeError(f"Failed to list pull requests: {e}") from e
-    finally:
-        await client.close()
+    client = await _get_client(context)
+    return await client.list_pull_requests(project=project, repository_id=repository_id, status=status, top=top)
 
 
 @app.tool(requires_secrets=AZURE_SECRETS)
+@_azure_tool("Failed to create pull request")
 async def create_pull_request(
     context: Context,
     project: Annotated[str, "Project name or ID"],
@@ -588,23 +882,19 @@ async def create_pull_request(
     is_draft: Annotated[bool, "Create as draft PR"] = False,
 ) -> Annotated[dict[str, Any], "Created pull request"]:
     """Create a new pull request."""
-    client = _get_client(context)
-    try:
-        return await client.create_pull_request(
-            project=project, repository_id=repository_id,
-            source_ref_name=source_ref_name, target_ref_name=target_ref_name,
-            title=title, description=description, is_draft=is_draft
-        )
-    except AzureDevOpsClientError as e:
-        raise RuntimeError(f"Failed to create pull request: {e}") from e
-    finally:
-        await client.close()
+    client = await _get_client(context)
+    return await client.create_pull_request(
+        project=project, repository_id=repository_id,
+        source_ref_name=source_ref_name, target_ref_name=target_ref_name,
+        title=title, description=description, is_draft=is_draft
+    )
 
 
 # ==================== Pipeline Tools ====================
 
 
 @app.tool(requires_secrets=AZURE_SECRETS)
+@_azure_tool("Failed to list build definitions")
 async def list_build_definitions(
     context: Context,
     project: Annotated[str, "Project name or ID"],
@@ -612,16 +902,12 @@ async def list_build_definitions(
     top: Annotated[int, "Maximum number of definitions to return"] = 50,
 ) -> Annotated[dict[str, Any], "List of build definitions"]:
     """List build/pipeline definitions in a project."""
-    client = _get_client(context)
-    try:
-        return await client.list_build_definitions(project=project, name=name, top=top)
-    except AzureDevOpsClientError as e:
-        raise RuntimeError(f"Failed to list build definitions: {e}") from e
-    finally:
-        await client.close()
+    client = await _get_client(context)
+    return await client.list_build_definitions(project=project, name=name, top=top)
 
 
 @app.tool(requires_secrets=AZURE_SECRETS)
+@_azure_tool("Failed to list builds")
 async def list_builds(
     context: Context,
     project: Annotated[str, "Project name or ID"],
@@ -630,16 +916,12 @@ async def list_builds(
     top: Annotated[int, "Maximum number of builds to return"] = 50,
 ) -> Annotated[dict[str, Any], "List of builds"]:
     """List builds in a project."""
-    client = _get_client(context)
-    try:
-        return await client.list_builds(project=project, status=status, result=result, top=top)
-    except AzureDevOpsClientError as e:
-        raise RuntimeError(f"Failed to list builds: {e}") from e
-    finally:
-        await client.close()
+    client = await _get_client(context)
+    return await client.list_builds(project=project, status=status, result=result, top=top)
 
 
 @app.tool(requires_secrets=AZURE_SECRETS)
+@_azure_tool("Failed to queue build")
 async def queue_build(
     context: Context,
     project: Annotated[str, "Project name or ID"],
@@ -647,16 +929,12 @@ async def queue_build(
     source_branch: Annotated[Optional[str], "Branch to build (e.g., 'refs/heads/main')"] = None,
 ) -> Annotated[dict[str, Any], "Queued build"]:
     """Queue a new build."""
-    client = _get_client(context)
-    try:
-        return await client.queue_build(project=project, definition_id=definition_id, source_branch=source_branch)
-    except AzureDevOpsClientError as e:
-        raise RuntimeError(f"Failed to queue build: {e}") from e
-    finally:
-        await client.close()
+    client = await _get_client(context)
+    return await client.queue_build(project=project, definition_id=definition_id, source_branch=source_branch)
 
 
 @app.tool(requires_secrets=AZURE_SECRETS)
+@_azure_tool("Failed to run pipeline")
 async def run_pipeline(
     context: Context,
     project: Annotated[str, "Project name or ID"],
@@ -664,34 +942,26 @@ async def run_pipeline(
     branch: Annotated[Optional[str], "Branch to run on (e.g., 'main')"] = None,
 ) -> Annotated[dict[str, Any], "Started pipeline run"]:
     """Start a new pipeline run."""
-    client = _get_client(context)
-    try:
-        return await client.run_pipeline(project=project, pipeline_id=pipeline_id, branch=branch)
-    except AzureDevOpsClientError as e:
-        raise RuntimeError(f"Failed to run pipeline: {e}") from e
-    finally:
-        await client.close()
+    client = await _get_client(context)
+    return await client.run_pipeline(project=project, pipeline_id=pipeline_id, branch=branch)
 
 
 # ==================== Wiki Tools ====================
 
 
 @app.tool(requires_secrets=AZURE_SECRETS)
+@_azure_tool("Failed to list wikis")
 async def list_wikis(
     context: Context,
     project: Annotated[Optional[str], "Project name or ID (optional)"] = None,
 ) -> Annotated[dict[str, Any], "List of wikis"]:
     """List wikis in a project or organization."""
-    client = _get_client(context)
-    try:
-        return await client.list_wikis(project=project)
-    except AzureDevOpsClientError as e:
-        raise RuntimeError(f"Failed to list wikis: {e}") from e
-    finally:
-        await client.close()
+    client = await _get_client(context)
+    return await client.list_wikis(project=project)
 
 
 @app.tool(requires_secrets=AZURE_SECRETS)
+@_azure_tool("Failed to get wiki page")
 async def get_wiki_page(
     context: Context,
     project: Annotated[str, "Project name or ID"],
@@ -700,19 +970,15 @@ async def get_wiki_page(
     include_content: Annotated[bool, "Include page content in response"] = True,
 ) -> Annotated[dict[str, Any], "Wiki page details and content"]:
     """Get a specific wiki page."""
-    client = _get_client(context)
-    try:
-        return await client.get_wiki_page(project=project, wiki_identifier=wiki_identifier, path=path, include_content=include_content)
-    except AzureDevOpsClientError as e:
-        raise RuntimeError(f"Failed to get wiki page: {e}") from e
-    finally:
-        await client.close()
+    client = await _get_client(context)
+    return await client.get_wiki_page(project=project, wiki_identifier=wiki_identifier, path=path, include_content=include_content)
 
 
 # ==================== Search Tools ====================
 
 
 @app.tool(requires_secrets=AZURE_SECRETS)
+@_azure_tool("Failed to search code")
 async def search_code(
     context: Context,
     search_text: Annotated[str, "Text to search for in code"],
@@ -721,13 +987,8 @@ async def search_code(
     top: Annotated[int, "Maximum number of results to return"] = 25,
 ) -> Annotated[dict[str, Any], "Code search results"]:
     """Search for code across repositories."""
-    client = _get_client(context)
-    try:
-        return await client.search_code(search_text=search_text, project=project, repository=repository, top=top)
-    except AzureDevOpsClientError as e:
-        raise RuntimeError(f"Failed to search code: {e}") from e
-    finally:
-        await client.close()
+    client = await _get_client(context)
+    return await client.search_code(search_text=search_text, project=project, repository=repository, top=top)
 
 
 # ==================== Entry Point ====================
@@ -739,7 +1000,45 @@ if __name__ == "__main__":
     # - "http": HTTPS streaming for Cursor, VS Code, etc.
     #   Requires Arcade Deploy or env vars for secrets
     transport = sys.argv[1] if len(sys.argv) > 1 else "stdio"
+    # Set MCP_STATELESS_HTTP=1 to skip session tracking on the HTTP transport
+    stateless = os.getenv("MCP_STATELESS_HTTP") == "1"
+
+    # Set MCP_HTTP_WORKERS=N to serve HTTP from N processes sharing the port.
+    # This process then only supervises the workers, each started with
+    # MCP_HTTP_WORKER=1. Sessions live in one process's memory and a client's
+    # next connection may land on another worker, so workers run stateless.
+    reuse_port = os.getenv("MCP_HTTP_WORKER") == "1"
+    if reuse_port:
+        stateless = True
+    elif transport in ("http", "streamable-http", "streamable") and hasattr(
+        socket, "SO_REUSEPORT"
+    ):
+        workers = _http_workers()
+        if workers > 1:
+            _supervise_workers(workers)
+            sys.exit(0)
+
+    # Use uvloop when the optional extra is installed (it does not support Windows)
+    loop_factory = None
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            loop_factory = uvloop.new_event_loop
 
     # Run the server
-    import asyncio
-    asyncio.run(app.run_async(transport=transport, host="127.0.0.1", port=8000))
+    main = app.run_async(
+        transport=transport,
+        host="127.0.0.1",
+        port=8000,
+        stateless=stateless,
+        reuse_port=reuse_port,
+    )
+    if sys.version_info >= (3, 12):
+        asyncio.run(main, loop_factory=loop_factory)
+    else:
+        if loop_factory is not None:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        asyncio.run(main)
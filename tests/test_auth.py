@@ -0,0 +1,67 @@
+"""Tests for resolving Azure DevOps credentials."""
+
+import pytest
+
+from arcade_azure_devops_mcp.auth import manager
+from arcade_azure_devops_mcp.auth.manager import AuthConfig
+
+
+class FakeContext:
+    """Arcade context stand-in serving a fixed set of secrets."""
+
+    def __init__(self, secrets: dict[str, str], user_id=None):
+        self.secrets = secrets
+        self.user_id = user_id
+
+    def get_secret(self, name: str) -> str:
+        if name not in self.secrets:
+            raise ValueError(f"Secret {name} not found")
+        return self.secrets[name]
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    for name in (
+        "AZURE_DEVOPS_ORG",
+        "AZURE_DEVOPS_PAT",
+        "AZURE_AD_CLIENT_ID",
+        "AZURE_AD_CLIENT_SECRET",
+        "AZURE_AD_TENANT_ID",
+    ):
+        monkeypatch.delenv(name, raising=False)
+    manager._SECRET_CONFIGS.clear()
+    yield
+    manager._SECRET_CONFIGS.clear()
+
+
+def test_contexts_without_user_do_not_share_secrets():
+    first = FakeContext({"AZURE_DEVOPS_ORG": "org-a", "AZURE_DEVOPS_PAT": "pat-a"})
+    second = FakeContext({"AZURE_DEVOPS_ORG": "org-b", "AZURE_DEVOPS_PAT": "pat-b"})
+
+    assert AuthConfig.from_env_or_context(first).pat == "pat-a"
+    config = AuthConfig.from_env_or_context(second)
+    assert (config.organization, config.pat) == ("org-b", "pat-b")
+
+
+def test_secrets_are_cached_per_user():
+    alice = FakeContext({"AZURE_DEVOPS_ORG": "org-a", "AZURE_DEVOPS_PAT": "pat-a"}, "alice")
+    bob = FakeContext({"AZURE_DEVOPS_ORG": "org-b", "AZURE_DEVOPS_PAT": "pat-b"}, "bob")
+
+    assert AuthConfig.from_env_or_context(alice).pat == "pat-a"
+    assert AuthConfig.from_env_or_context(bob).pat == "pat-b"
+
+    # A later context for alice is served from the cache without a lookup
+    alice.secrets = {}
+    assert AuthConfig.from_env_or_context(alice).pat == "pat-a"
+
+
+def test_context_pat_is_used_when_only_org_comes_from_env(monkeypatch):
+    monkeypatch.setenv("AZURE_DEVOPS_ORG", "env-org")
+    context = FakeContext({"AZURE_DEVOPS_PAT": "ctx-pat"}, "alice")
+
+    for config in (
+        AuthConfig.from_context(context),
+        AuthConfig.from_env_or_context(context),
+    ):
+        assert (config.organization, config.pat) == ("env-org", "ctx-pat")
+
@@ -0,0 +1,222 @@
+"""Tests for the Azure DevOps REST client."""
+
+import asyncio
+from typing import Any, Callable, Optional
+
+import httpx
+import pytest
+
+from arcade_azure_devops_mcp.auth.manager import AuthConfig, AuthManager
+from arcade_azure_devops_mcp.client import AzureDevOpsClient, AzureDevOpsClientError
+
+BASE = "https://dev.azure.com/org"
+
+
+def make_client(handler: Optional[Callable[[httpx.Request], Any]] = None) -> AzureDevOpsClient:
+    """Build a client for org "org", answering requests with handler if given."""
+    auth = AuthManager(AuthConfig(organization="org", pat="pat"))
+    if handler is None:
+        return AzureDevOpsClient(auth)
+    return AzureDevOpsClient(auth, http=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+
+def paged(items: list[int]):
+    """Build a $top/$skip fetch over items that records each skip requested."""
+    calls: list[int] = []
+
+    async def fetch(top: int, skip: int) -> dict:
+        calls.append(skip)
+        return {"value": items[skip : skip + top]}
+
+    return fetch, calls
+
+
+@pytest.mark.asyncio
+async def test_list_all_by_skip_single_page_costs_one_request():
+    fetch, calls = paged(list(range(7)))
+    items = await make_client()._list_all_by_skip(fetch, page_size=10, max_concurrency=5)
+    assert items == list(range(7))
+    assert calls == [0]
+
+
+@pytest.mark.asyncio
+async def test_list_all_by_skip_fetches_windows_until_short_page():
+    fetch, calls = paged(list(range(101)))
+    items = await make_client()._list_all_by_skip(fetch, page_size=10, max_concurrency=4)
+    assert items == list(range(101))
+    # First page alone, then windows of four pages until page 10 comes back short
+    assert calls == [0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100, 110, 120]
+
+
+@pytest.mark.asyncio
+async def test_list_all_by_skip_stops_at_max_pages():
+    calls: list[int] = []
+
+    async def always_full(top: int, skip: int) -> dict:
+        calls.append(skip)
+        return {"value": [0] * top}
+
+    client = make_client()
+    client.MAX_LIST_PAGES = 5
+    with pytest.raises(AzureDevOpsClientError):
+        await client._list_all_by_skip(always_full, page_size=2, max_concurrency=3)
+    assert len(calls) == 5
+
+
+class VersionedApi:
+    """Mock ADO API whose GETs return the number of completed writes."""
+
+    def __init__(self, write_delay: float = 0.0):
+        self.version = 0
+        self.gets = 0
+        self.write_delay = write_delay
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            self.gets += 1
+            return httpx.Response(200, json={"version": self.version})
+        await asyncio.sleep(self.write_delay)
+        self.version += 1
+        return httpx.Response(200, json={"id": self.version})
+
+
+@pytest.mark.asyncio
+async def test_cached_get_is_served_until_ttl_expires():
+    api = VersionedApi()
+    client = make_client(api)
+    url = f"{BASE}/proj/_apis/wit/things"
+
+    assert await client._cached_get(url, ttl=0.05) == {"version": 0}
+    assert await client._cached_get(url, ttl=0.05) == {"version": 0}
+    assert api.gets == 1
+
+    await asyncio.sleep(0.06)
+    await client._cached_get(url, ttl=0.05)
+    assert api.gets == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_evicts_least_recently_used_entry():
+    api = VersionedApi()
+    client = make_client(api)
+    client.CACHE_MAX_ENTRIES = 2
+    a, b, c = (f"{BASE}/proj/_apis/{name}" for name in "abc")
+
+    await client._cached_get(a, ttl=60)
+    await client._cached_get(b, ttl=60)
+    await client._cached_get(a, ttl=60)  # a is now the most recently used
+    await client._cached_get(c, ttl=60)  # evicts b
+    assert api.gets == 3
+
+    await client._cached_get(a, ttl=60)
+    assert api.gets == 3
+    await client._cached_get(b, ttl=60)
+    assert api.gets == 4
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_request():
+    api = VersionedApi()
+    client = make_client(api)
+    url = f"{BASE}/proj/_apis/wit/things"
+
+    results = await asyncio.gather(*(client._cached_get(url, ttl=60) for _ in range(5)))
+    assert results == [{"version": 0}] * 5
+    assert api.gets == 1
+
+
+@pytest.mark.asyncio
+async def test_read_racing_a_write_is_not_cached():
+    api = VersionedApi(write_delay=0.05)
+    client = make_client(api)
+    url = f"{BASE}/proj/_apis/testplan/plans"
+
+    write = asyncio.create_task(client.create_test_plan("proj", "Plan"))
+    await asyncio.sleep(0.01)
+    # Lands while the write is in flight, so it sees the pre-write state
+    assert await client._cached_get(url, ttl=60) == {"version": 0}
+    await write
+
+    assert await client._cached_get(url, ttl=60) == {"version": 1}
+
+
+@pytest.mark.asyncio
+async def test_write_invalidates_org_level_project_lookups():
+    api = VersionedApi()
+    client = make_client(api)
+
+    assert await client.get_project("proj") == {"version": 0}
+    assert await client.list_teams("proj") == {"version": 0}
+    await client.create_test_plan("proj", "Plan")
+
+    assert await client.get_project("proj") == {"version": 1}
+    assert await client.list_teams("proj") == {"version": 1}
+
+
+@pytest.mark.asyncio
+async def test_throttled_request_is_retried_after_retry_after():
+    statuses = [429, 200]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(statuses.pop(0), headers={"Retry-After": "0"}, json={})
+
+    response = await make_client(handler)._send("GET", f"{BASE}/_apis/projects")
+    assert response.status_code == 200
+    assert statuses == []
+
+
+@pytest.mark.asyncio
+async def test_unavailable_write_is_not_retried():
+    calls = {"POST": 0, "GET": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls[request.method] += 1
+        return httpx.Response(503, headers={"Retry-After": "0"})
+
+    client = make_client(handler)
+    with pytest.raises(AzureDevOpsClientError) as error:
+        await client._send("POST", f"{BASE}/proj/_apis/wit/workitems/$Bug")
+    assert error.value.status_code == 503
+    assert calls["POST"] == 1
+
+    # Reads are idempotent, so the same 503 is retried up to MAX_RETRIES
+    with pytest.raises(AzureDevOpsClientError):
+        await client._send("GET", f"{BASE}/_apis/projects")
+    assert calls["GET"] == client.MAX_RETRIES + 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status, invalidated", [(401, True), (403, False)])
+async def test_only_unauthorized_invalidates_auth(monkeypatch, status, invalidated):
+    client = make_client(lambda request: httpx.Response(status))
+    calls: list[bool] = []
+    monkeypatch.setattr(client.auth, "invalidate_token", lambda: calls.append(True))
+
+    with pytest.raises(AzureDevOpsClientError):
+        await client._send("GET", f"{BASE}/_apis/projects")
+    assert bool(calls) is invalidated
+
+
+@pytest.mark.asyncio
+async def test_requests_per_organization_are_capped(monkeypatch):
+    monkeypatch.setattr(AzureDevOpsClient, "MAX_CONCURRENT_REQUESTS", 3)
+    in_flight = peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={})
+
+    # Two clients for the same organization share its slots
+    clients = [make_client(handler), make_client(handler)]
+    await asyncio.gather(
+        *(
+            client._send("GET", f"{BASE}/_apis/projects")
+            for client in clients
+            for _ in range(10)
+        )
+    )
+    assert peak == 3
@@ -0,0 +1,153 @@
+"""Tests for decoding Azure DevOps responses into the response models."""
+
+from dataclasses import asdict
+from datetime import datetime, timezone
+
+from arcade_azure_devops_mcp.models import (
+    BUILD_ADAPTER,
+    BUILD_LIST_ADAPTER,
+    PULL_REQUEST_ADAPTER,
+    PULL_REQUEST_LIST_ADAPTER,
+    TEST_SUITE_LIST_ADAPTER,
+    WORK_ITEM_ADAPTER,
+    WORK_ITEM_LIST_ADAPTER,
+    Build,
+    DynamicTestSuite,
+    GitCommitRef,
+    GitRef,
+    ListResponse,
+    OtherTestSuite,
+    PipelineRun,
+    RequirementTestSuite,
+    StaticTestSuite,
+    WorkItemComment,
+    WorkItemReference,
+    adapter,
+    decode,
+    list_adapter,
+)
+
+
+def test_reference_models_decode_camel_case():
+    commit = decode(
+        GitCommitRef,
+        b'{"commitId": "abc123", "comment": "Fix build", "author": {"name": "Ann"}}',
+    )
+    assert commit.commit_id == "abc123"
+    assert commit.comment == "Fix build"
+    assert commit.author == {"name": "Ann"}
+
+    ref = decode(
+        GitRef,
+        b'{"name": "refs/heads/main", "objectId": "def456", "creator": {"displayName": "Ann"}}',
+    )
+    assert ref.object_id == "def456"
+    assert ref.creator == {"displayName": "Ann"}
+
+    reference = decode(WorkItemReference, b'{"id": 7, "url": "https://x/7"}')
+    assert reference == WorkItemReference(id=7, url="https://x/7")
+
+
+def test_reference_models_accept_field_names():
+    assert GitCommitRef(commit_id="abc").commit_id == "abc"
+    assert GitRef(name="refs/heads/main", object_id="def").object_id == "def"
+
+
+def test_list_adapters_decode_camel_case():
+    commits = list_adapter(GitCommitRef).validate_json(
+        b'{"count": 2, "value": [{"commitId": "a"}, {"commitId": "b"}]}'
+    )
+    assert isinstance(commits, ListResponse)
+    assert commits.count == 2
+    assert [c.commit_id for c in commits.value] == ["a", "b"]
+
+    refs = list_adapter(WorkItemReference).validate_json(
+        b'{"count": 1, "value": [{"id": 1}]}'
+    )
+    assert refs.value == [WorkItemReference(id=1)]
+
+
+def test_prebuilt_adapters_decode_camel_case():
+    work_item = WORK_ITEM_ADAPTER.validate_json(
+        b'{"id": 1, "rev": 3, "fields": {"System.Title": "Bug"}}'
+    )
+    assert work_item.rev == 3
+    work_items = WORK_ITEM_LIST_ADAPTER.validate_json(
+        b'{"count": 1, "value": [{"id": 1, "rev": 3}]}'
+    )
+    assert work_items.value[0].id == 1
+
+    pr_payload = (
+        b'{"pullRequestId": 5, "sourceRefName": "refs/heads/dev",'
+        b' "targetRefName": "refs/heads/main", "isDraft": false}'
+    )
+    pull_request = PULL_REQUEST_ADAPTER.validate_json(pr_payload)
+    assert pull_request.pull_request_id == 5
+    assert pull_request.source_ref_name == "refs/heads/dev"
+    assert pull_request.is_draft is False
+    pull_requests = PULL_REQUEST_LIST_ADAPTER.validate_json(
+        b'{"count": 1, "value": [' + pr_payload + b"]}"
+    )
+    assert pull_requests.value[0].target_ref_name == "refs/heads/main"
+
+    build_payload = b'{"id": 9, "buildNumber": "20240101.1", "sourceBranch": "refs/heads/main"}'
+    build = BUILD_ADAPTER.validate_json(build_payload)
+    assert build.build_number == "20240101.1"
+    builds = BUILD_LIST_ADAPTER.validate_json(
+        b'{"count": 1, "value": [' + build_payload + b"]}"
+    )
+    assert builds.value[0].source_branch == "refs/heads/main"
+
+
+def test_timestamps_decode_to_datetimes():
+    build = BUILD_ADAPTER.validate_json(
+        b'{"id": 1, "queueTime": "2024-01-02T03:04:05.1234567Z", "finishTime": null}'
+    )
+    assert build.queue_time == datetime(2024, 1, 2, 3, 4, 5, 123456, tzinfo=timezone.utc)
+    assert build.finish_time is None
+
+
+def test_timestamp_fields_construct_by_name():
+    created = datetime(2024, 1, 2, tzinfo=timezone.utc)
+    comment = WorkItemComment(id=1, text="Looks good", created_date=created)
+    assert comment.created_date == created
+
+    run = PipelineRun(id=2, created_date=created)
+    assert run.created_date == created
+
+
+def test_timestamp_fields_dump_under_original_names():
+    created = datetime(2024, 1, 2, tzinfo=timezone.utc)
+    comment = WorkItemComment(id=1, text="Looks good", created_date=created)
+    assert comment.model_dump() == {
+        "id": 1,
+        "text": "Looks good",
+        "created_by": None,
+        "created_date": created,
+    }
+    assert comment.model_dump(by_alias=True)["createdDate"] == created
+
+    build = Build(id=3, queue_time=created)
+    dumped = adapter(Build).dump_python(build)
+    assert dumped["queue_time"] == created
+    assert asdict(build)["queue_time"] == created
+
+
+def test_test_suite_listing_dispatches_on_suite_type():
+    suites = TEST_SUITE_LIST_ADAPTER.validate_json(
+        b'{"count": 4, "value": ['
+        b'{"id": 1, "name": "Static", "suiteType": "staticTestSuite"},'
+        b'{"id": 2, "name": "Query", "suiteType": "dynamicTestSuite", "queryString": "q"},'
+        b'{"id": 3, "name": "Req", "suiteType": "requirementTestSuite", "requirementId": 7},'
+        b'{"id": 4, "name": "Root", "suiteType": "none"}'
+        b"]}"
+    )
+    assert [type(suite) for suite in suites.value] == [
+        StaticTestSuite,
+        DynamicTestSuite,
+        RequirementTestSuite,
+        OtherTestSuite,
+    ]
+    assert suites.value[1].query_string == "q"
+    assert suites.value[2].requirement_id == 7
+    assert suites.value[3].suite_type == "none"
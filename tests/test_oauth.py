@@ -0,0 +1,50 @@
+"""Tests for the Azure AD client credentials token handler."""
+
+import asyncio
+import time
+
+import pytest
+
+from arcade_azure_devops_mcp.auth.oauth import OAuthHandler
+
+
+class FakeOAuthHandler(OAuthHandler):
+    """Handler whose MSAL call is replaced by a counting stub."""
+
+    def __init__(self, expires_in: int = 3600):
+        super().__init__(client_id="client", client_secret="secret", tenant_id="tenant")
+        self.expires_in = expires_in
+        self.acquired = 0
+
+    def _acquire_sync(self):
+        time.sleep(0.02)
+        self.acquired += 1
+        return {"access_token": f"token-{self.acquired}", "expires_in": self.expires_in}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_token_request():
+    handler = FakeOAuthHandler()
+    try:
+        tokens = await asyncio.gather(*(handler.get_access_token() for _ in range(10)))
+    finally:
+        handler.close()
+    assert tokens == ["token-1"] * 10
+    assert handler.acquired == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_token_is_reused_until_it_nears_expiry():
+    handler = FakeOAuthHandler()
+    try:
+        assert await handler.get_access_token() == "token-1"
+        assert await handler.get_access_token() == "token-1"
+        assert handler.acquired == 1
+
+        # A token within EXPIRY_MARGIN of expiring is treated as stale
+        handler.expires_in = handler.EXPIRY_MARGIN
+        handler.clear_cache()
+        assert await handler.get_access_token() == "token-2"
+        assert await handler.get_access_token() == "token-3"
+    finally:
+        handler.close()
@@ -0,0 +1,45 @@
+"""Tests for the MCP server's per-session client handling."""
+
+import pytest
+
+import server
+
+
+class FakeContext:
+    """Arcade context stand-in identifying a session and user."""
+
+    def __init__(self, session_id: str, user_id: str):
+        self.session_id = session_id
+        self.user_id = user_id
+
+    def get_secret(self, name: str) -> str:
+        raise ValueError(f"Secret {name} not found")
+
+
+@pytest.fixture(autouse=True)
+def credentials(monkeypatch):
+    monkeypatch.setenv("AZURE_DEVOPS_ORG", "org")
+    monkeypatch.setenv("AZURE_DEVOPS_PAT", "pat")
+    server._CLIENTS.clear()
+    yield
+    server._CLIENTS.clear()
+
+
+@pytest.mark.asyncio
+async def test_session_client_is_reused_across_tool_calls():
+    try:
+        first = await server._get_client(FakeContext("session-1", "user-1"))
+        again = await server._get_client(FakeContext("session-1", "user-1"))
+        other_user = await server._get_client(FakeContext("session-1", "user-2"))
+        other_session = await server._get_client(FakeContext("session-2", "user-1"))
+
+        assert again is first
+        assert other_user is not first
+        assert other_session is not first
+        # Every session client shares the process-wide connection pool
+        assert first._client is other_session._client is server._get_http()
+
+        await server._close_session_clients("session-1")
+        assert set(server._CLIENTS) == {("session-2", "user-1")}
+    finally:
+        await server._close_http()